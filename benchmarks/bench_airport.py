@@ -0,0 +1,63 @@
+"""Benchmarks of ``plastik.airport``."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import plastik
+
+SIZES = [100, 10_000, pytest.param(1_000_000, marks=pytest.mark.large)]
+
+
+def _arrays(size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    arr1 = rng.normal(size=size)
+    return arr1, arr1 + rng.normal(0.1, 0.2, size=size), rng.normal(0, 0.2, size=size)
+
+
+def _airport(arrays):
+    fig, ax = plt.subplots()
+    plastik.airport(*arrays, ax)
+    return fig
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_construct(benchmark, record_memory, size):
+    arrays = _arrays(size)
+    benchmark(lambda: plt.close(_airport(arrays)))
+    record_memory(_airport, arrays)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+def test_savefig(savefig, fmt):
+    savefig(_airport(_arrays(10_000)), fmt)
+
+
+def _airport_many(triples):
+    fig, axs = plt.subplots(len(triples) // 10, 10)
+    airport = plastik.Airport()
+    airport.config()
+    airport.plot_many(triples, axs.ravel())
+    return fig
+
+
+@pytest.mark.parametrize("count", [10, 50])
+def test_plot_many(benchmark, record_memory, count):
+    rng = np.random.default_rng(0)
+    triples = [tuple(rng.normal(size=(3, 1_000))) for _ in range(count)]
+    benchmark(lambda: plt.close(_airport_many(triples)))
+    record_memory(_airport_many, triples)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("backend", ["pdf", "cdf", "kde", "ecdf", "ccdf", "histogram"])
+def test_backend(benchmark, backend, size):
+    values = _arrays(size)[0]
+    airport = plastik.Airport()
+    airport.set_dist_func(backend)
+
+    def run():
+        bins, _ = airport.dist_func_discrete(airport.bins, values)
+        return airport.dist_func_continuous(bins, values)
+
+    benchmark(run)
@@ -0,0 +1,36 @@
+"""Benchmarks of ``plastik.colors``."""
+
+import matplotlib.pyplot as plt
+import pytest
+
+import plastik
+
+
+@pytest.mark.parametrize("n", [10, 1_000])
+def test_create_colorlist(benchmark, n):
+    plastik.colors.colorlist_cache_clear()
+    benchmark(plastik.colors.create_colorlist, "viridis", n)
+
+
+@pytest.mark.parametrize(
+    "colors", [10, 100, pytest.param(1_000, marks=pytest.mark.large)]
+)
+def test_make_color_swatch(benchmark, record_memory, colors):
+    c_bar = plastik.colors.create_colorlist("viridis", colors)
+
+    def draw():
+        fig, ax = plt.subplots(figsize=(10, 1))
+        plastik.colors.make_color_swatch(ax, c_bar)
+        plt.close(fig)
+
+    benchmark(draw)
+    record_memory(draw)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+def test_savefig(savefig, fmt):
+    fig, ax = plt.subplots(figsize=(10, 1))
+    plastik.colors.make_color_swatch(
+        ax, plastik.colors.create_colorlist("viridis", 100)
+    )
+    savefig(fig, fmt)
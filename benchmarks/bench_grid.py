@@ -0,0 +1,24 @@
+"""Benchmarks of ``plastik.figure_grid``."""
+
+import pytest
+
+import plastik
+
+GRIDS = [(1, 1), (3, 3), (6, 6), pytest.param((12, 12), marks=pytest.mark.large)]
+
+
+@pytest.mark.parametrize("share_axes", [False, "both"])
+@pytest.mark.parametrize("grid", GRIDS, ids=lambda g: f"{g[0]}x{g[1]}")
+def test_construct(benchmark, record_memory, grid, share_axes):
+    using = {"share_axes": share_axes}
+    benchmark(plastik.figure_grid, *grid, using)
+    record_memory(plastik.figure_grid, *grid, using)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+@pytest.mark.parametrize("grid", [(1, 1), (3, 3)], ids=lambda g: f"{g[0]}x{g[1]}")
+def test_savefig(savefig, grid, fmt):
+    fig, axs = plastik.figure_grid(*grid)
+    for i, ax in enumerate(axs):
+        ax.plot([0, 1, 2], [0, i, 2 * i])
+    savefig(fig, fmt)
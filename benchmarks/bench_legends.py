@@ -0,0 +1,47 @@
+"""Benchmarks of ``plastik.topside_legends``."""
+
+import matplotlib.pyplot as plt
+import pytest
+
+import plastik
+
+
+def _axes(lines: int):
+    fig, ax = plt.subplots()
+    for i in range(lines):
+        ax.plot([0, 1], [0, i], label=f"line {i}")
+    return fig, ax
+
+
+@pytest.mark.parametrize("lines", [4, 40, pytest.param(400, marks=pytest.mark.large)])
+def test_construct(benchmark, record_memory, lines):
+    _, ax = _axes(lines)
+    benchmark(plastik.topside_legends, ax, c_max=5)
+    record_memory(plastik.topside_legends, ax, c_max=5)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+def test_savefig(savefig, fmt):
+    fig, ax = _axes(40)
+    plastik.topside_legends(ax, c_max=5)
+    savefig(fig, fmt)
+
+
+@pytest.mark.parametrize("columns", [2, 8])
+def test_many(benchmark, record_memory, columns):
+    fig, axs = plastik.figure_grid(2, columns)
+    for ax in axs:
+        for i in range(20):
+            ax.plot([0, 1], [0, i], label=f"line {i}")
+    benchmark(plastik.topside_legends_many, axs, c_max=5)
+    record_memory(plastik.topside_legends_many, axs, c_max=5)
+
+
+@pytest.mark.parametrize("columns", [2, 8])
+def test_figure_legend(benchmark, record_memory, columns):
+    fig, axs = plastik.figure_grid(2, columns)
+    for ax in axs:
+        for i in range(20):
+            ax.plot([0, 1], [0, i], c=f"C{i % 10}", label=f"line {i}")
+    benchmark(plastik.figure_legend, fig, axs, c_max=5)
+    record_memory(plastik.figure_legend, fig, axs, c_max=5)
@@ -0,0 +1,47 @@
+"""Benchmarks of ``plastik.percentiles``."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import plastik
+
+MEMBERS = [100, 1_000, pytest.param(10_000, marks=pytest.mark.large)]
+LENGTHS = [1_000, 100_000, pytest.param(1_000_000, marks=pytest.mark.large)]
+
+
+def _ensemble(members: int, length: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    return np.arange(length), rng.normal(size=(members, length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+@pytest.mark.parametrize("members", MEMBERS)
+def test_percentile_bands(benchmark, record_memory, members, length):
+    _, y = _ensemble(members, length)
+    benchmark(plastik.percentile_bands, y, 20)
+    record_memory(plastik.percentile_bands, y, 20)
+
+
+@pytest.mark.parametrize("renderer", ["fill_between", "collection"])
+@pytest.mark.parametrize("n", [5, 50])
+def test_construct(benchmark, record_memory, n, renderer):
+    x, y = _ensemble(100, 10_000)
+    bands = plastik.percentile_bands(y, n)
+
+    def draw():
+        fig, ax = plt.subplots()
+        plastik.percentiles(x, bands, ax=ax, renderer=renderer)
+        plt.close(fig)
+
+    benchmark(draw)
+    record_memory(draw)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+@pytest.mark.parametrize("renderer", ["fill_between", "collection"])
+def test_savefig(savefig, fmt, renderer):
+    x, y = _ensemble(100, 10_000)
+    fig, ax = plt.subplots()
+    plastik.percentiles(x, y, 20, ax=ax, renderer=renderer)
+    savefig(fig, fmt)
@@ -0,0 +1,37 @@
+"""Benchmarks of ``plastik.Ridge``."""
+
+import numpy as np
+import pytest
+
+import plastik
+
+RIDGES = [5, 50, pytest.param(500, marks=pytest.mark.large)]
+LENGTHS = [1_000, 100_000, pytest.param(1_000_000, marks=pytest.mark.large)]
+
+
+def _data(ridges: int, length: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(0)
+    x = np.linspace(1, 100, length)
+    return [(x, rng.normal(size=length).cumsum()) for _ in range(ridges)]
+
+
+def _ridge(data, options, engine="axes"):
+    r = plastik.Ridge(data, options, ylabel="y", xlabel="x", engine=engine)
+    r.main()
+    return r
+
+
+@pytest.mark.parametrize("engine", ["axes", "collection"])
+@pytest.mark.parametrize("options", ["gs", "z", "b"])
+@pytest.mark.parametrize("length", LENGTHS)
+@pytest.mark.parametrize("ridges", RIDGES)
+def test_construct(benchmark, record_memory, ridges, length, options, engine):  # noqa: PLR0913, PLR0917
+    data = _data(ridges, length)
+    benchmark(_ridge, data, options, engine)
+    record_memory(_ridge, data, options, engine)
+
+
+@pytest.mark.parametrize("fmt", ["png", "pdf", "svg"])
+@pytest.mark.parametrize("ridges", [5, 50])
+def test_savefig(savefig, ridges, fmt):
+    savefig(_ridge(_data(ridges, 10_000), "gs").figure, fmt)
@@ -0,0 +1,101 @@
+"""Shared set-up of the benchmark suite.
+
+The benchmarks run headless on the Agg backend with ``pytest-benchmark``::
+
+    uv run pytest benchmarks --benchmark-autosave
+    uv run pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The largest data sizes are only included with ``--large``. Each benchmark also stores
+the peak memory and the ``plastik.profile`` phases of one extra run in its
+``extra_info``, which is saved alongside the timings.
+"""
+
+import importlib.util
+import io
+import pathlib
+from collections.abc import Callable
+from typing import Any
+
+import matplotlib as mpl
+
+mpl.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+
+import plastik  # noqa: E402
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["bench_*.py"]
+
+
+def pytest_collect_file(
+    file_path: pathlib.Path, parent: pytest.Collector
+) -> pytest.Module | None:
+    """Collect the ``bench_*.py`` files as test modules."""
+    # Files given on the command line are already collected by pytest itself
+    if parent.session.isinitpath(file_path):
+        return None
+    if file_path.suffix == ".py" and file_path.name.startswith("bench_"):
+        return pytest.Module.from_parent(parent, path=file_path)
+    return None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the ``--large`` option."""
+    parser.addoption(
+        "--large", action="store_true", help="include the largest data sizes"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the ``large`` marker."""
+    config.addinivalue_line("markers", "large: benchmark with the largest data sizes")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks marked as ``large`` unless ``--large`` is given."""
+    if config.getoption("--large"):
+        return
+    skip = pytest.mark.skip(reason="needs --large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    yield
+    plt.close("all")
+
+
+@pytest.fixture
+def record_memory(benchmark: Any) -> Callable[..., None]:
+    """Run a function once more to record its peak memory and profiled phases."""
+
+    def record(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        # The phases reset the peak of tracemalloc, which the profile accounts for
+        with plastik.profile() as prof:
+            func(*args, **kwargs)
+        benchmark.extra_info["peak_memory"] = prof.peak
+        benchmark.extra_info["phases"] = prof.to_dict()["totals"]
+        plt.close("all")
+
+    return record
+
+
+@pytest.fixture
+def savefig(benchmark: Any) -> Callable[[mpl.figure.Figure, str], None]:
+    """Benchmark saving a figure to memory, and record the file size."""
+
+    def save(fig: mpl.figure.Figure, fmt: str) -> None:
+        def run() -> int:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fmt)
+            return buffer.tell()
+
+        benchmark.extra_info["file_size"] = benchmark(run)
+
+    return save
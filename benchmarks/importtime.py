@@ -0,0 +1,80 @@
+"""Track the start-up cost of ``import plastik``.
+
+Runs ``python -X importtime -c "import plastik"`` in fresh interpreters and reports
+the cumulative import time of ``plastik`` and the slowest modules it pulls in. Run it
+from the repository root::
+
+    uv run python benchmarks/importtime.py --repeat 10 --json importtime.json
+
+With ``--max-ms`` the script exits with a non-zero status if the import is slower than
+the given budget, which makes it usable as a regression check.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+def measure(statement: str) -> dict[str, tuple[int, int]]:
+    """Return the self and cumulative import time in microseconds of each module.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to time, typically an import statement.
+
+    Returns
+    -------
+    dict[str, tuple[int, int]]
+        Mapping from module name to its (self, cumulative) import time.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--max-ms", type=float, help="fail above this import time")
+    args = parser.parse_args()
+
+    runs = [measure("import plastik") for _ in range(args.repeat)]
+    # The fastest run is the least disturbed by other processes
+    best = min(runs, key=lambda times: times["plastik"][1])
+    total_ms = best["plastik"][1] / 1e3
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    print(f"import plastik: {total_ms:.1f} ms (best of {args.repeat})")
+    for module, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"{self_us / 1e3:10.1f} ms {cumulative_us / 1e3:10.1f} ms  {module}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "plastik_ms": total_ms,
+                    "runs_ms": [times["plastik"][1] / 1e3 for times in runs],
+                    "modules_us": best,
+                },
+                f,
+                indent=2,
+            )
+    if args.max_ms is not None and total_ms > args.max_ms:
+        sys.exit(f"import plastik took {total_ms:.1f} ms > {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,99 @@
 """Library for creating beautiful and insightful visualizations."""
 
+import importlib
 import importlib.metadata
-from importlib.metadata import version
+import sys
+import types
+from typing import TYPE_CHECKING, Any
 
-from plastik import colors, lines
+from plastik import lines
 from plastik.axes import *  # noqa:F401,F403
 from plastik.grid import *  # noqa:F401,F403
 from plastik.legends import *  # noqa:F401,F403
-from plastik.percentiles import percentiles
-from plastik.ridge import *  # noqa:F401,F403
+from plastik.percentiles import (
+    PercentileBands,
+    percentile_bands,
+    percentile_bands_streaming,
+    percentiles,
+)
+from plastik.profiling import profile
 
-try:
+if TYPE_CHECKING:
+    from plastik import colors
     from plastik.airport import Airport, airport
-except importlib.metadata.PackageNotFoundError:
-    # We were not able to find the package `fppanalysis`
-
-    def need_extra(*_, **k):
-        raise ImportError(
-            "Please install with extra dependencies: `pip install plastik[extra]`"
-        )
-
-    Airport = need_extra  # type: ignore[misc,assignment]
-    airport = need_extra  # type: ignore[assignment]
-except ImportError:
-    # We were not able to find the correct version of the package `fppanalysis`
-
-    def need_extra(*_, **k):
-        raise ImportError(
-            "The package 'fppanalysis' cannot be at version 0.1.4. You may want to "
-            "explicitly install it to your project as "
-            "`git+https://github.com/uit-cosmo/fpp-analysis-tools@main`."
-        )
-
-    Airport = need_extra  # type: ignore[misc,assignment]
-    airport = need_extra  # type: ignore[assignment]
-
-__version__ = version(__package__)
-__all__ = ["Airport", "airport", "colors", "lines", "percentiles"]
+    from plastik.cache import RenderCache
+    from plastik.parallel import RenderJob, RenderResult, render_parallel
+    from plastik.ridge import Ridge
+
+# Modules with heavy dependencies (palettable, cmcrameri and attrs, or the
+# process pool) are only imported on first attribute access, see PEP 562.
+_LAZY_ATTRIBUTES = {
+    "colors": ("plastik.colors", None),
+    "ridge": ("plastik.ridge", None),
+    "Ridge": ("plastik.ridge", "Ridge"),
+    "RenderCache": ("plastik.cache", "RenderCache"),
+    "RenderJob": ("plastik.parallel", "RenderJob"),
+    "RenderResult": ("plastik.parallel", "RenderResult"),
+    "render_parallel": ("plastik.parallel", "render_parallel"),
+}
+
+
+def _load_airport(name: str) -> Any:
+    # Importing the submodule binds it to the package, so both names are replaced
+    _bind_airport(importlib.import_module("plastik.airport"))
+    return globals()[name]
+
+
+def _bind_airport(module: types.ModuleType) -> None:
+    globals()["Airport"] = module.Airport
+    globals()["airport"] = module.airport
+
+
+class _Package(types.ModuleType):
+    """Keep ``plastik.airport`` the instance, also after ``import plastik.airport``."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "airport" and isinstance(value, types.ModuleType):
+            _bind_airport(value)
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = importlib.metadata.version(__package__)
+    elif name in {"Airport", "airport"}:
+        value = _load_airport(name)
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "Airport", "airport", "__version__"})
+
+
+__all__ = [
+    "Airport",
+    "PercentileBands",
+    "RenderCache",
+    "RenderJob",
+    "RenderResult",
+    "Ridge",
+    "airport",
+    "colors",
+    "lines",
+    "percentile_bands",
+    "percentile_bands_streaming",
+    "percentiles",
+    "profile",
+    "render_parallel",
+]
@@ -1,21 +1,217 @@
 """Create an airport-plot on a ``matplotlib.axes.Axes`` object."""
 
-import importlib.metadata
+import collections
+import concurrent.futures
+import functools
+import math
+import os
+import weakref
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
 
-if importlib.metadata.version("fppanalysis") == "0.1.4":
-    raise ImportError
-
-from collections.abc import Callable
-
-import fppanalysis
 import matplotlib as mpl
 import numpy as np
-import scipy
 from numpy.typing import NDArray
 
+from plastik.profiling import phase
+
+# The number of distributions kept by each Airport object
+_DISTRIBUTION_CACHE_SIZE = 16
+# The smallest and largest number of grid points of the binned KDE
+_KDE_MIN_GRID = 512
+_KDE_MAX_GRID = 2**20
+# Chebyshev fit of erfc(x) * exp(x**2) in t = 1 / (1 + x / 2), highest power first,
+# from Numerical Recipes. The relative error of erfc is below 1.2e-7 for all x.
+_ERFC_COEFFICIENTS = np.array(
+    [
+        0.17087277,
+        -0.82215223,
+        1.48851587,
+        -1.13520398,
+        0.27886807,
+        -0.18628806,
+        0.09678418,
+        0.37409196,
+        1.00002368,
+        -1.26551223,
+    ]
+)
+
+
+def _bin_centers(edges: NDArray[np.float64]) -> NDArray[np.float64]:
+    return (edges[..., :-1] + edges[..., 1:]) / 2
+
+
+def _norm_fit(
+    y: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return the maximum likelihood mean and standard deviation of a normal fit.
+
+    This is the closed form of ``scipy.stats.norm.fit(y)``, fitted along the last axis
+    of 'y' so that each row of a 2-D array gets its own fit.
+    """
+    loc = y.mean(axis=-1, keepdims=True)
+    return loc, np.sqrt(((y - loc) ** 2).mean(axis=-1, keepdims=True))
+
+
+def _erfc(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return the complementary error function, to a relative error of 1.2e-7."""
+    t = 1 / (1 + 0.5 * np.abs(x))
+    y = t * np.exp(np.polyval(_ERFC_COEFFICIENTS, t) - x**2)
+    return np.where(x < 0, 2 - y, y)
+
+
+def _norm_cdf(z: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return the standard normal CDF, as ``scipy.special.ndtr`` does.
+
+    The complementary error function keeps the lower tail accurate, where ``1 + erf``
+    would round to zero.
+    """
+    return 0.5 * _erfc(-np.asarray(z, dtype=np.float64) / math.sqrt(2))
+
+
+def _bandwidth(y: NDArray[np.float64]) -> float:
+    """Return Silverman's rule of thumb bandwidth of a Gaussian KDE of 'y'."""
+    spread = y.std()
+    q25, q75 = np.percentile(y, (25, 75))
+    if q75 > q25:
+        spread = min(spread, (q75 - q25) / 1.34)
+    if spread == 0:
+        # All values are equal, use the same width as the histogram does
+        return 0.5
+    return float(0.9 * spread * y.size ** (-1 / 5))
+
+
+def _kde(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return a Gaussian KDE of 'y' evaluated at 'x', by binning and FFT convolution.
+
+    The values are linearly binned onto a regular grid with at least four points per
+    bandwidth, which is convolved with the kernel through the FFT and interpolated at
+    'x'. The cost is linear in the size of 'y', rather than the size of 'y' times 'x'
+    of evaluating each kernel.
+    """
+    y = np.ravel(y)
+    h = _bandwidth(y)
+    start = min(y.min(), np.min(x)) - 4 * h
+    span = max(y.max(), np.max(x)) + 4 * h - start
+    n_grid = int(np.clip(span / (h / 4), _KDE_MIN_GRID, _KDE_MAX_GRID)) + 1
+    dx = span / (n_grid - 1)
+    pos = (y - start) / dx
+    index = np.minimum(pos.astype(np.intp), n_grid - 2)
+    weight = pos - index
+    counts = np.bincount(index, 1 - weight, n_grid)
+    counts += np.bincount(index + 1, weight, n_grid)
+    # The kernel is cut at four bandwidths, or at the end of the grid
+    half = min(int(np.ceil(4 * h / dx)), n_grid - 1)
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) * dx / h) ** 2)
+    size = 1 << int(np.ceil(np.log2(n_grid + 2 * half)))
+    density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = density[half : half + n_grid] / (y.size * h * np.sqrt(2 * np.pi))
+    grid = start + dx * np.arange(n_grid)
+    return np.interp(x, grid, np.maximum(density, 0), left=0, right=0)
+
+
+def _ecdf(
+    x: NDArray[np.float64], y: NDArray[np.float64], *, complementary: bool = False
+) -> NDArray[np.float64]:
+    """Return the fraction of 'y' that is at most, or above, each point of 'x'."""
+    sorted_y = np.sort(y, axis=None)
+    below = np.searchsorted(sorted_y, x, side="right")
+    if complementary:
+        return (sorted_y.size - below) / sorted_y.size
+    return below / sorted_y.size
+
+
+def _bin_edges_rows(n_bins: int, values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return ``np.histogram_bin_edges(row, n_bins)`` of each row of 'values'."""
+    first, last = values.min(axis=1), values.max(axis=1)
+    same = first == last
+    first, last = np.where(same, first - 0.5, first), np.where(same, last + 0.5, last)
+    return np.linspace(first, last, n_bins + 1, axis=1)
+
+
+def _histogram_rows(
+    n_bins: int, values: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return `Airport.dist_func_discrete_pdf` of each row of 'values'.
+
+    The counting follows ``np.histogram`` step by step, so the result is the same as
+    calling it on each row, but all rows are binned by a single ``np.bincount``.
+    """
+    edges = _bin_edges_rows(n_bins, values)
+    first, last = edges[:, :1], edges[:, -1:]
+    rows = np.arange(len(values))[:, np.newaxis]
+    indices = ((values - first) / (last - first) * n_bins).astype(np.intp)
+    indices[indices == n_bins] -= 1
+    # Correct for rounding errors in the computed index, as np.histogram does
+    indices[values < edges[rows, indices]] -= 1
+    indices[(values >= edges[rows, indices + 1]) & (indices != n_bins - 1)] += 1
+    counts = np.bincount(
+        (indices + rows * n_bins).ravel(), minlength=values.shape[0] * n_bins
+    ).reshape(-1, n_bins)
+    pdf = counts / np.diff(edges, axis=1) / counts.sum(axis=1, keepdims=True)
+    return _bin_centers(edges), pdf
+
+
+def _ecdf_rows(
+    n_bins: int, values: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return `Airport.dist_func_discrete_cdf` of each row of 'values'."""
+    centers = _bin_centers(_bin_edges_rows(n_bins, values))
+    sorted_values = np.sort(values, axis=1)
+    ecdf = np.arange(values.shape[1]) / float(values.shape[1])
+    cdf = np.empty_like(centers)
+    for i, (x, xp) in enumerate(zip(centers, sorted_values, strict=True)):
+        cdf[i] = np.interp(x, xp, ecdf)
+    return centers, cdf
+
+
+def _distributions(
+    dist_func_discrete: Callable[
+        [int, NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]
+    ],
+    dist_func_continuous: Callable[
+        [NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]
+    ],
+    n_bins: int,
+    values: NDArray[np.float64],
+) -> list[tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]]:
+    """Return the bins, discrete and continuous distribution of each row of 'values'.
+
+    The built-in distribution functions are computed for all rows at once. Other
+    functions are called once per row.
+    """
+    row_wise = _ROW_WISE.get(dist_func_discrete)
+    if row_wise is not None and dist_func_continuous in _BROADCASTING:
+        bins, dist = row_wise(n_bins, values)
+        return list(zip(bins, dist, dist_func_continuous(bins, values), strict=True))
+    results = []
+    for row in values:
+        bins, dist = dist_func_discrete(n_bins, row)
+        results.append((bins, dist, dist_func_continuous(bins, row)))
+    return results
+
 
 class Airport:
-    """Create an airport-plot."""
+    """Create an airport-plot.
+
+    The binned distributions and fitted curves are cached per input array object and
+    number of bins, so re-plotting the same arrays, for example after changing the
+    styling with ``config``, does not compute them again. Arrays that are changed in
+    place are not detected, call ``cache_clear`` after doing so.
+    """
+
+    def __init__(self) -> None:
+        self._distributions: collections.OrderedDict[
+            Hashable,
+            tuple[
+                list[weakref.ref],
+                tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]],
+            ],
+        ] = collections.OrderedDict()
+        self.bins = 30
+        self.dist_func_discrete = self.dist_func_discrete_pdf
+        self.dist_func_continuous = self.dist_func_continuous_pdf
 
     def _setup(
         self,
@@ -38,9 +234,6 @@ class Airport:
         self.control = control
         self.labels = labels
         self.ax_labels = ax_labels
-        self.bins = 30
-        self.dist_func_discrete = self.dist_func_discrete_pdf
-        self.dist_func_continuous = self.dist_func_continuous_pdf
 
     def __call__(  # noqa: PLR0913
         self,
@@ -93,6 +286,8 @@ class Airport:
         distribution_xline: float = 0.9,
         runway_end: float = 1.35,
         runway_start: float = -0.05,
+        runway_density_threshold: int | None = 100_000,
+        runway_density_bins: int = 256,
         runway_data_kwargs: dict | None = None,
         dist_data_kwargs: dict | None = None,
         dist_ctrl_kwargs: dict | None = None,
@@ -111,6 +306,13 @@ class Airport:
             Place the runway end at this point relative to the data points.
         runway_start : float
             Place the runway start at this point relative to the data points.
+        runway_density_threshold : int | None
+            Above this many data points, the runway data is drawn as a rasterized 2D
+            histogram instead of a scatter plot, which is faster and keeps vector
+            output small. Give None to always use a scatter plot, or 0 to always use
+            the histogram. The distributions are always drawn as vector graphics.
+        runway_density_bins : int
+            The number of bins along each axis of the runway data histogram.
         runway_data_kwargs : dict | None
             Keyword arguments to give to the runway scatter plot.
         dist_data_kwargs : dict | None
@@ -142,10 +344,13 @@ class Airport:
         }
         if dist_ctrl_kwargs is not None:
             _dist_ctrl_kwargs |= dist_ctrl_kwargs
+        self.bins = bins
         self.distribution_scaling = distribution_scaling
         self.distribution_xline = distribution_xline
         self.runway_end = runway_end
         self.runway_start = runway_start
+        self.runway_density_threshold = runway_density_threshold
+        self.runway_density_bins = runway_density_bins
         self.runway_data_kwargs = _runway_data_kwargs
         self.dist_data_kwargs = _dist_data_kwargs
         self.dist_ctrl_kwargs = _dist_ctrl_kwargs
@@ -155,69 +360,385 @@ class Airport:
         n_bins: int, values: NDArray[np.float64]
     ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
         """Probability distribution function estimate (discrete)."""
-        out = fppanalysis.distribution(values, n_bins, ccdf=False)
-        return out[2], out[0]
+        pdf, edges = np.histogram(values, n_bins, density=True)
+        return _bin_centers(edges), pdf
 
     @staticmethod
     def dist_func_continuous_pdf(
         x: NDArray[np.float64], y: NDArray[np.float64]
     ) -> NDArray[np.float64]:
         """Probability distribution function estimate (continuous)."""
-        fit_diff = scipy.stats.norm.fit(y)
-        return scipy.stats.norm.pdf(x, *fit_diff)
+        loc, scale = _norm_fit(y)
+        z = (x - loc) / scale
+        return np.exp(-(z**2) / 2) / (np.sqrt(2 * np.pi) * scale)
 
     @staticmethod
     def dist_func_discrete_cdf(
         n_bins: int, values: NDArray[np.float64]
     ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
         """Cumulative distribution function estimate (discrete)."""
-        out = fppanalysis.distribution(values, n_bins, ccdf=False)
-        return out[2], out[1]
+        # The bins are the same as for the histogram, without counting the values
+        edges = np.histogram_bin_edges(values, n_bins)
+        sorted_values = np.sort(values)
+        ecdf = np.arange(len(sorted_values)) / float(len(sorted_values))
+        centers = _bin_centers(edges)
+        return centers, np.interp(centers, sorted_values, ecdf)
 
     @staticmethod
     def dist_func_continuous_cdf(
         x: NDArray[np.float64], y: NDArray[np.float64]
     ) -> NDArray[np.float64]:
         """Cumulative distribution function estimate (discrete)."""
-        fit_diff = scipy.stats.norm.fit(y)
-        return scipy.stats.norm.cdf(x, *fit_diff)
+        loc, scale = _norm_fit(y)
+        return _norm_cdf((x - loc) / scale)
+
+    @staticmethod
+    def dist_func_discrete_kde(
+        n_bins: int, values: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Gaussian kernel density estimate (discrete), at the centres of the bins."""
+        centers = _bin_centers(np.histogram_bin_edges(values, n_bins))
+        return centers, _kde(centers, values)
+
+    @staticmethod
+    def dist_func_continuous_kde(
+        x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Gaussian kernel density estimate (continuous).
+
+        The bandwidth is given by Silverman's rule of thumb, and the estimate is
+        computed on a binned grid with the FFT, which scales to tens of millions of
+        values.
+        """
+        return _kde(x, y)
+
+    @staticmethod
+    def dist_func_discrete_ecdf(
+        n_bins: int, values: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Empirical cumulative distribution function (discrete)."""
+        centers = _bin_centers(np.histogram_bin_edges(values, n_bins))
+        return centers, _ecdf(centers, values)
+
+    @staticmethod
+    def dist_func_continuous_ecdf(
+        x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Empirical cumulative distribution function (continuous)."""
+        return _ecdf(x, y)
+
+    @staticmethod
+    def dist_func_discrete_ccdf(
+        n_bins: int, values: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Empirical complementary cumulative distribution function (discrete)."""
+        centers = _bin_centers(np.histogram_bin_edges(values, n_bins))
+        return centers, _ecdf(centers, values, complementary=True)
+
+    @staticmethod
+    def dist_func_continuous_ccdf(
+        x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Empirical complementary cumulative distribution function (continuous)."""
+        return _ecdf(x, y, complementary=True)
+
+    @staticmethod
+    def dist_func_continuous_histogram(
+        x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Histogram density estimate (continuous).
+
+        The bins have equal widths and are centred on the points in 'x', which should
+        be evenly spaced, such as the bins given by ``dist_func_discrete_pdf``.
+        """
+        half = (x[-1] - x[0]) / max(len(x) - 1, 1) / 2 or 0.5
+        counts, edges = np.histogram(y, len(x), range=(x[0] - half, x[-1] + half))
+        return counts / np.diff(edges) / np.size(y)
 
     def set_dist_func(
         self,
-        dist_func_discrete: Callable[
+        dist_func_discrete: str
+        | Callable[
             [int, NDArray[np.float64]],
             tuple[NDArray[np.float64], NDArray[np.float64]],
         ],
         dist_func_continuous: Callable[
             [NDArray[np.float64], NDArray[np.float64]],
             NDArray[np.float64],
-        ],
+        ]
+        | None = None,
     ) -> None:
-        """Specify a custom distribution function to use in the plot.
+        """Specify the distribution functions to use in the plot.
 
-        Two functions are expected, one discrete and one continuous. See the two
-        implementaitons for PDF and CDF as examples.
+        Either give the name of one of the built-in backends, or two functions, one
+        discrete and one continuous. See the built-in ``dist_func_*`` methods as
+        examples. The built-in backends are
+
+        - 'pdf': a histogram and a fitted normal distribution (default).
+        - 'cdf': the interpolated empirical CDF and a fitted normal CDF.
+        - 'kde': a Gaussian kernel density estimate, see ``dist_func_continuous_kde``.
+        - 'ecdf': the empirical CDF.
+        - 'ccdf': the empirical complementary CDF.
+        - 'histogram': a histogram, also as the continuous curve.
 
         Parameters
         ----------
-        dist_func_discrete : Callable[[int, NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]]
-            A function that takes in the number of bins and the values to use.
-        dist_func_continuous : Callable[[NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]]
+        dist_func_discrete : str | Callable[[int, NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]]
+            The name of a backend, or a function that takes in the number of bins and
+            the values to use.
+        dist_func_continuous : Callable[[NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]] | None
             A function that takes in the x-axis to to use and the y-values to fit to.
+            Must be given with a discrete function, and not with a backend name.
+
+        Raises
+        ------
+        ValueError
+            If the backend is not known, or if the functions are not given as a pair.
+
+        Examples
+        --------
+        >>> airport = Airport()
+        >>> airport.set_dist_func("kde")
+        >>> airport.dist_func_continuous is Airport.dist_func_continuous_kde
+        True
         """
+        if isinstance(dist_func_discrete, str):
+            if dist_func_continuous is not None:
+                raise ValueError(
+                    "A continuous function cannot be given with a backend name."
+                )
+            if dist_func_discrete not in _BACKENDS:
+                raise ValueError(
+                    f"Unknown backend {dist_func_discrete!r}, expected one of "
+                    f"{', '.join(map(repr, _BACKENDS))}."
+                )
+            dist_func_discrete, dist_func_continuous = _BACKENDS[dist_func_discrete]
+        elif dist_func_continuous is None:
+            raise ValueError("A continuous function must be given.")
         self.dist_func_discrete = dist_func_discrete  # type: ignore[assignment]
         self.dist_func_continuous = dist_func_continuous  # type: ignore[assignment]
 
+    def cache_clear(self) -> None:
+        """Forget the cached distributions."""
+        self._distributions.clear()
+
+    def _cache_key(self, sources: tuple[NDArray[np.float64], ...]) -> Hashable:
+        return (
+            self.dist_func_discrete,
+            self.dist_func_continuous,
+            self.bins,
+            *((id(s), s.shape, s.strides, s.dtype.str) for s in sources),
+        )
+
+    def _cache_get(
+        self, key: Hashable, sources: tuple[NDArray[np.float64], ...]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]] | None:
+        cached = self._distributions.get(key)
+        # An id can be reused once the array is gone, so also check that it is alive
+        if cached is None or not all(
+            ref() is s for ref, s in zip(cached[0], sources, strict=True)
+        ):
+            return None
+        self._distributions.move_to_end(key)
+        return cached[1]
+
+    def _cache_put(
+        self,
+        key: Hashable,
+        sources: tuple[NDArray[np.float64], ...],
+        result: tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]],
+    ) -> None:
+        self._distributions[key] = ([weakref.ref(s) for s in sources], result)
+        self._distributions.move_to_end(key)
+        if len(self._distributions) > _DISTRIBUTION_CACHE_SIZE:
+            self._distributions.popitem(last=False)
+
+    def _distribution(
+        self,
+        sources: tuple[NDArray[np.float64], ...],
+        basis: Callable[[], NDArray[np.float64]],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Return the bins, discrete and continuous distribution of 'basis()'.
+
+        The result is cached on the distribution functions, the number of bins and the
+        identity of the 'sources' that 'basis' is computed from.
+        """
+        key = self._cache_key(sources)
+        result = self._cache_get(key, sources)
+        if result is None:
+            values = basis()
+            bins, dist = self.dist_func_discrete(self.bins, values)
+            result = (bins, dist, self.dist_func_continuous(bins, values))
+            self._cache_put(key, sources, result)
+        return result
+
+    @phase("Airport.plot_many")
+    def plot_many(  # noqa: PLR0913
+        self,
+        pairs: Sequence[
+            tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        ],
+        axes: Sequence[mpl.axes.Axes],
+        labels: tuple[str | None, str | None, str | None] = (
+            "Arr2-Arr1",
+            "Control",
+            "Runway data",
+        ),
+        ax_labels: tuple[str, str, str] = (
+            "X label",
+            "Y label",
+            "Distribution X label",
+        ),
+        *,
+        workers: int | None = 1,
+    ) -> list[mpl.axes.Axes]:
+        """Create an airport-plot of each triple with the current settings.
+
+        Each ``(arr1, arr2, control)`` triple is plotted as by ``plot`` on the axes at
+        the same position in 'axes'. The distributions of all triples are computed
+        before anything is drawn, with the built-in distribution functions in one
+        vectorised pass over all triples of the same size. Several triples may share
+        an axes, in which case the runway is only drawn once for each set of limits,
+        the labels are only given to the first triple, and one legend is made.
+
+        Parameters
+        ----------
+        pairs : Sequence[tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]]
+            The ``(arr1, arr2, control)`` triples to plot.
+        axes : Sequence[mpl.axes.Axes]
+            The axes to plot each triple on.
+        labels : tuple[str | None, str | None, str | None]
+            The labels of the distributions and the runway data.
+        ax_labels : tuple[str, str, str]
+            The labels of the x and y axes, and of the distribution axis.
+        workers : int | None
+            Compute the distributions in this many worker processes. With None, the
+            number of CPUs is used. Custom distribution functions must then be
+            picklable. Default is 1, which computes them in the calling process.
+
+        Returns
+        -------
+        list[mpl.axes.Axes]
+            The axes of each triple.
+
+        Raises
+        ------
+        ValueError
+            If 'pairs' and 'axes' differ in length, or 'workers' is not positive.
+        """
+        if len(pairs) != len(axes):
+            raise ValueError(
+                f"Got {len(pairs)} pairs but {len(axes)} axes, they must be equal."
+            )
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers < 1:
+            raise ValueError(f"'workers' must be positive, got {workers}.")
+        with phase("distributions"):
+            distributions = self._distributions_many(pairs, workers)
+        # The (limits, std) of the runways drawn on each axes, and the axes with labels
+        runways: dict[mpl.axes.Axes, set[Hashable]] = {}
+        for (arr1, arr2, control), ax, (ctrl, diff) in zip(
+            pairs, axes, distributions, strict=True
+        ):
+            shared = ax in runways
+            self._setup(
+                arr1, arr2, control, (None, None, None) if shared else labels, ax_labels
+            )
+            self._draw(ax, ctrl, diff, runways.setdefault(ax, set()), legend=False)
+        for ax in runways:
+            ax.legend(loc="lower right")
+        return list(axes)
+
+    def _distributions_many(
+        self,
+        pairs: Sequence[
+            tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        ],
+        workers: int,
+    ) -> list[tuple[tuple[NDArray[np.float64], ...], tuple[NDArray[np.float64], ...]]]:
+        """Return the control and difference distributions of each triple."""
+        results: dict[Hashable, tuple[NDArray[np.float64], ...]] = {}
+        keys = []
+        # The distributions that are not cached, grouped by the size of their values
+        missing: dict[
+            int, dict[Hashable, tuple[tuple[int, ...], tuple[NDArray[np.float64], ...]]]
+        ] = {}
+        for arr1, arr2, control in pairs:
+            self._setup(arr1, arr2, control)
+            both: tuple[tuple[NDArray[np.float64], ...], ...] = (
+                (control,),
+                (arr1, arr2),
+            )
+            for sources in both:
+                key = self._cache_key(sources)
+                keys.append(key)
+                if key in results:
+                    continue
+                cached = self._cache_get(key, sources)
+                if cached is not None:
+                    results[key] = cached
+                    continue
+                shape = np.broadcast_shapes(*(s.shape for s in sources))
+                missing.setdefault(int(np.prod(shape)), {})[key] = (shape, sources)
+        for size, group in missing.items():
+            # Stack the values of each distribution as rows, without temporary arrays
+            values = np.empty((len(group), size))
+            for row, (shape, sources) in zip(values, group.values(), strict=True):
+                if len(sources) == 1:
+                    np.negative(sources[0], out=row.reshape(shape))
+                else:
+                    np.subtract(sources[0], sources[1], out=row.reshape(shape))
+            compute = functools.partial(
+                _distributions,
+                self.dist_func_discrete,
+                self.dist_func_continuous,
+                self.bins,
+            )
+            n_chunks = min(workers, len(values))
+            if n_chunks == 1:
+                rows = compute(values)
+            else:
+                with concurrent.futures.ProcessPoolExecutor(n_chunks) as executor:
+                    chunks = executor.map(compute, np.array_split(values, n_chunks))
+                    rows = [result for chunk in chunks for result in chunk]
+            for (key, (_, sources)), result in zip(group.items(), rows, strict=True):
+                results[key] = result
+                self._cache_put(key, sources, result)
+        return [
+            (results[ctrl], results[diff])
+            for ctrl, diff in zip(keys[::2], keys[1::2], strict=True)
+        ]
+
+    @phase("Airport._plot")
     def _plot(
         self,
         ax: mpl.axes.Axes,
     ) -> mpl.axes.Axes:
         """Create an airport-plot on the given axes object."""
-        ctrl_basis = -1 * self.control
-        ctrl_bins, ctrl_dist = self.dist_func_discrete(self.bins, ctrl_basis)
-        diff_basis = self.arr1 - self.arr2
-        diff_bins, diff_dist = self.dist_func_discrete(self.bins, diff_basis)
-        xy_range = np.sum([self.arr2, self.arr1], axis=0).flatten()
+        with phase("distributions"):
+            ctrl = self._distribution((self.control,), lambda: -1 * self.control)
+            diff = self._distribution(
+                (self.arr1, self.arr2), lambda: self.arr1 - self.arr2
+            )
+        return self._draw(ax, ctrl, diff)
+
+    def _draw(
+        self,
+        ax: mpl.axes.Axes,
+        ctrl: tuple[NDArray[np.float64], ...],
+        diff: tuple[NDArray[np.float64], ...],
+        runways: set[Hashable] | None = None,
+        *,
+        legend: bool = True,
+    ) -> mpl.axes.Axes:
+        """Draw an airport-plot of the given distributions.
+
+        The runway is not drawn if its limits and width are already in 'runways', and
+        they are added to it otherwise.
+        """
+        ctrl_bins, ctrl_dist, norm_ctrl = ctrl
+        diff_bins, diff_dist, norm_diff = diff
+        xy_range = np.add(self.arr2, self.arr1).ravel()
         # xmy_range = np.diff([self.arr1, self.arr2], axis=0).flatten()
         xy_range_diff = abs(xy_range.max() - xy_range.min())
         # xmy_range_diff = abs(xmy_range.max() - xmy_range.min())
@@ -234,40 +755,43 @@ class Airport:
             ((self.runway_end - 1) * xy_range_diff + xy_range.max()) / 2,
         )
         std = self.control.std() / 2
-        ax.annotate(
-            "",
-            xy=(lims[1], lims[1]),
-            xytext=(lims[0], lims[0]),
-            arrowprops={
-                "shrinkA": 0,
-                "shrinkB": 0,
-                "arrowstyle": "->",
-                "lw": 0.7,
-                "color": "grey",
-            },
-        )
-        ax.fill(
-            [lims[0] - std, lims[1] - std, lims[1] + std, lims[0] + std],
-            [lims[0] + std, lims[1] + std, lims[1] - std, lims[0] - std],
-            "grey",
-            alpha=0.3,
-        )
-        ax.fill(
-            [
-                lims[0] - 2 * std,
-                lims[1] - 2 * std,
-                lims[1] + 2 * std,
-                lims[0] + 2 * std,
-            ],
-            [
-                lims[0] + 2 * std,
-                lims[1] + 2 * std,
-                lims[1] - 2 * std,
-                lims[0] - 2 * std,
-            ],
-            "grey",
-            alpha=0.3,
-        )
+        if runways is None or (lims, std) not in runways:
+            ax.annotate(
+                "",
+                xy=(lims[1], lims[1]),
+                xytext=(lims[0], lims[0]),
+                arrowprops={
+                    "shrinkA": 0,
+                    "shrinkB": 0,
+                    "arrowstyle": "->",
+                    "lw": 0.7,
+                    "color": "grey",
+                },
+            )
+            ax.fill(
+                [lims[0] - std, lims[1] - std, lims[1] + std, lims[0] + std],
+                [lims[0] + std, lims[1] + std, lims[1] - std, lims[0] - std],
+                "grey",
+                alpha=0.3,
+            )
+            ax.fill(
+                [
+                    lims[0] - 2 * std,
+                    lims[1] - 2 * std,
+                    lims[1] + 2 * std,
+                    lims[0] + 2 * std,
+                ],
+                [
+                    lims[0] + 2 * std,
+                    lims[1] + 2 * std,
+                    lims[1] - 2 * std,
+                    lims[0] - 2 * std,
+                ],
+                "grey",
+                alpha=0.3,
+            )
+            if runways is not None:
+                runways.add((lims, std))
         dist_ax_start = 1.05 * max(diff_bins.max(), ctrl_bins.max()) / 2
         dist_ax_end = 1.30 * min(ctrl_bins.min(), diff_bins.min()) / 2
         ax.annotate(
@@ -309,8 +833,6 @@ class Airport:
             label=self.labels[1],
             **self.dist_ctrl_kwargs,  # type: ignore[arg-type]
         )
-        norm_diff = self.dist_func_continuous(diff_bins, diff_basis)
-        norm_ctrl = self.dist_func_continuous(ctrl_bins, ctrl_basis)
         ax.plot(
             bins_diff_xskew + norm_ctrl * self.distribution_scaling,
             norm_ctrl * self.distribution_scaling - bins_diff_yskew,
@@ -321,20 +843,79 @@ class Airport:
             norm_diff * self.distribution_scaling - bins_ctrl_yskew,
             c=self.dist_ctrl_kwargs["c"],
         )
-        ax.scatter(
-            self.arr1,
-            self.arr2,
-            label=self.labels[2],
-            **self.runway_data_kwargs,  # type: ignore[arg-type]
-        )
+        self._draw_runway_data(ax)
         ax.set_xlabel(self.ax_labels[0])
         ax.set_ylabel(self.ax_labels[1])
-        ax.legend(loc="lower right")
+        if legend:
+            ax.legend(loc="lower right")
         ylim_min = ax.get_ylim()[0]
         ylim_max = -1.70 * min(ctrl_bins.min(), diff_bins.min()) / 2 + shift_x
         ylim_max = max(ylim_max, ax.get_ylim()[1])
         ax.set_ylim((ylim_min, ylim_max + 0.05 * (ylim_max - ylim_min)))
         return ax
 
+    def _draw_runway_data(self, ax: mpl.axes.Axes) -> None:
+        """Draw the runway data as a scatter plot, or as a density image if large."""
+        threshold = self.runway_density_threshold
+        if threshold is None or np.size(self.arr1) <= threshold:
+            ax.scatter(
+                self.arr1,
+                self.arr2,
+                label=self.labels[2],
+                **self.runway_data_kwargs,  # type: ignore[arg-type]
+            )
+            return
+        x, y = np.broadcast_arrays(self.arr1, self.arr2)
+        counts, x_edges, y_edges = np.histogram2d(
+            x.ravel(), y.ravel(), self.runway_density_bins
+        )
+        kwargs: dict[str, Any] = dict(self.runway_data_kwargs)
+        color = kwargs.pop("c", kwargs.pop("color", "C0"))
+        if not mpl.colors.is_color_like(color):
+            # Colours per data point cannot be shown by the histogram
+            color = "C0"
+        rgba = mpl.colors.to_rgba(color)
+        image = ax.imshow(
+            np.ma.masked_equal(counts.T, 0),
+            cmap=mpl.colors.LinearSegmentedColormap.from_list(
+                "runway", [(*rgba[:3], 0.2 * rgba[3]), rgba]
+            ),
+            norm=mpl.colors.LogNorm(),
+            aspect=ax.get_aspect(),
+            interpolation="nearest",
+            origin="lower",
+            extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+            zorder=kwargs.get("zorder", 10),
+        )
+        # Keep the margins around the data, as with the scatter plot
+        image.sticky_edges.x.clear()
+        image.sticky_edges.y.clear()
+        # An empty scatter plot gives the runway data its legend entry
+        ax.scatter([], [], label=self.labels[2], color=color, **kwargs)
+
+
+# Row-wise versions of the built-in discrete distribution functions, and the built-in
+# continuous functions, which broadcast over rows as they are
+_ROW_WISE: dict[Callable, Callable] = {
+    Airport.dist_func_discrete_pdf: _histogram_rows,
+    Airport.dist_func_discrete_cdf: _ecdf_rows,
+}
+_BROADCASTING: set[Callable] = {
+    Airport.dist_func_continuous_pdf,
+    Airport.dist_func_continuous_cdf,
+}
+
+# The built-in backends of Airport.set_dist_func
+_BACKENDS: dict[str, tuple[Callable, Callable]] = {
+    "pdf": (Airport.dist_func_discrete_pdf, Airport.dist_func_continuous_pdf),
+    "cdf": (Airport.dist_func_discrete_cdf, Airport.dist_func_continuous_cdf),
+    "kde": (Airport.dist_func_discrete_kde, Airport.dist_func_continuous_kde),
+    "ecdf": (Airport.dist_func_discrete_ecdf, Airport.dist_func_continuous_ecdf),
+    "ccdf": (Airport.dist_func_discrete_ccdf, Airport.dist_func_continuous_ccdf),
+    "histogram": (
+        Airport.dist_func_discrete_pdf,
+        Airport.dist_func_continuous_histogram,
+    ),
+}
 
 airport = Airport()
@@ -0,0 +1,463 @@
+"""Cache rendered figures on disk, keyed on everything that goes into them."""
+
+import functools
+import hashlib
+import importlib.metadata
+import os
+import pathlib
+import pickle
+import secrets
+import shutil
+import threading
+import time
+import types
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+
+from plastik.profiling import phase
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+# Temporary files older than this are left over from crashed writers
+_STALE_SECONDS = 3600
+_TMP_SUFFIX = ".tmp"
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _versions() -> tuple[str, str]:
+    try:
+        plastik_version = importlib.metadata.version("plastik")
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        plastik_version = "unknown"
+    return mpl.__version__, plastik_version
+
+
+# The versions that may change the output, which are part of every key
+_VERSIONS = _versions()
+
+
+class RenderCacheInfo(NamedTuple):
+    """Statistics of a `RenderCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    files: int
+    size: int
+
+
+def _hasher() -> Any:
+    return xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+
+
+def _update(h: Any, value: Any, seen: set[int] | None = None) -> None:  # noqa: PLR0911, PLR0912
+    """Feed a value to the hash, with a type tag so that e.g. 1 and '1' differ.
+
+    'seen' holds the functions that are being hashed, which may refer to themselves.
+    """
+    seen = set() if seen is None else seen
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            h.update(b"object-array")
+            _update(h, value.tolist(), seen)
+            return
+        h.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        buffer = np.ascontiguousarray(value)
+        h.update(memoryview(buffer).cast("B"))  # type: ignore[arg-type]
+        return
+    if isinstance(value, str | bytes | int | float | complex | bool | None):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+        return
+    if isinstance(value, np.generic):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+        return
+    if isinstance(value, list | tuple | frozenset):
+        items = sorted(value, key=repr) if isinstance(value, frozenset) else value
+        h.update(f"{type(value).__name__}[{len(value)}](".encode())
+        for item in items:
+            _update(h, item, seen)
+        h.update(b")")
+        return
+    if isinstance(value, dict):
+        h.update(f"dict[{len(value)}](".encode())
+        for key in sorted(value, key=repr):
+            _update(h, key, seen)
+            _update(h, value[key], seen)
+        h.update(b")")
+        return
+    if isinstance(value, types.CodeType):
+        h.update(b"code:" + value.co_code)
+        _update(h, value.co_consts, seen)
+        _update(h, value.co_names, seen)
+        return
+    if isinstance(value, types.FunctionType):
+        _update_function(h, value, seen)
+        return
+    if isinstance(value, types.MethodType):
+        h.update(b"method:")
+        _update(h, value.__func__, seen)
+        _update(h, value.__self__, seen)
+        return
+    if isinstance(value, functools.partial):
+        h.update(b"partial:")
+        _update(h, (value.func, value.args, value.keywords), seen)
+        return
+    # Classes and functions written in C, such as ufuncs, are pickled by their name
+    try:
+        h.update(b"pickle:" + pickle.dumps(value, protocol=5))
+    except Exception as err:
+        raise TypeError(f"Cannot hash a value of type {type(value).__name__}.") from err
+
+
+def _update_function(h: Any, func: types.FunctionType, seen: set[int]) -> None:
+    """Feed a function to the hash, with its code, defaults and closure."""
+    # Different closures and lambdas share their name, so also hash what they run
+    h.update(f"function:{func.__module__}.{func.__qualname__};".encode())
+    if id(func) in seen:
+        return
+    seen.add(id(func))
+    _update(h, func.__code__, seen)
+    _update(h, func.__defaults__, seen)
+    _update(h, func.__kwdefaults__, seen)
+    cells = []
+    for cell in func.__closure__ or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:
+            # An empty cell
+            cells.append(None)
+    _update(h, cells, seen)
+
+
+def hash_inputs(*args: Any, **kwargs: Any) -> str:
+    """Return a hash of the given values and the active rcParams.
+
+    Arrays are hashed from their buffers, with their type and shape. Lists, tuples and
+    dicts are hashed item by item. Functions are hashed by their qualified name,
+    bytecode, default values and the contents of their closure, and methods also by
+    the object they are bound to. Global variables that a function reads are not
+    included. Any other value is hashed from its pickle. The versions of matplotlib
+    and plastik are included, since they may change the output.
+
+    Parameters
+    ----------
+    *args : Any
+        The values to hash.
+    **kwargs : Any
+        Named values to hash.
+
+    Returns
+    -------
+    str
+        The hash as a hex string, from xxhash if installed, otherwise from BLAKE2.
+
+    Raises
+    ------
+    TypeError
+        If a value cannot be pickled, such as an object that holds a lambda.
+
+    Examples
+    --------
+    >>> x = np.arange(5)
+    >>> hash_inputs(x, n=20) == hash_inputs(x.copy(), n=20)
+    True
+    >>> hash_inputs(x, n=20) == hash_inputs(x, n=21)
+    False
+    """
+    h = _hasher()
+    _update(h, args)
+    _update(h, kwargs)
+    _update(h, dict(mpl.rcParams))
+    _update(h, _VERSIONS)
+    return h.hexdigest()
+
+
+def _create_temporary(directory: pathlib.Path, prefix: str) -> tuple[int, str]:
+    """Create a new temporary file and return its file descriptor and path.
+
+    Unlike ``tempfile.mkstemp``, the file gets the same permissions as a file created
+    with ``open``, so the umask of the process applies.
+    """
+    while True:
+        tmp = os.path.join(directory, f"{prefix}{secrets.token_hex(8)}{_TMP_SUFFIX}")
+        try:
+            return os.open(tmp, _TMP_FLAGS, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+class RenderCache:
+    """A directory of rendered figures, keyed on the hash of their inputs.
+
+    Files are stored as ``<directory>/<key[:2]>/<key>.<format>``. Writes go through a
+    temporary file that is moved into place, so several processes can share a
+    directory and never see a partially written file. When the directory grows beyond
+    'max_bytes', the least recently used files are removed. Each hit updates the
+    modification time of the file, which is what the eviction goes by. The size of the
+    directory is counted once, and then kept up to date with the files written through
+    this object. Files written by other processes are therefore only counted the next
+    time the directory is scanned, which happens whenever the count exceeds
+    'max_bytes'.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        Where to keep the rendered files. Created if it does not exist.
+    max_bytes : int | None
+        The largest total size of the cached files. Defaults to 1 GiB. With None the
+        cache is never evicted.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> def draw(y):
+    ...     fig = Figure()
+    ...     fig.add_subplot().plot(y)
+    ...     return fig
+    >>> cache = RenderCache(tempfile.mkdtemp())
+    >>> first = cache.render(draw, np.arange(10), fmt="png")
+    >>> second = cache.render(draw, np.arange(10), fmt="png")
+    >>> first == second, cache.info().hits
+    (True, 1)
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike, max_bytes: int | None = 2**30
+    ) -> None:
+        self.directory = pathlib.Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+        # The total size of the cached files, or None until the directory is scanned
+        self._size: int | None = None
+
+    def path(self, key: str, fmt: str) -> pathlib.Path:
+        """Return where the file of a key and format is stored.
+
+        Parameters
+        ----------
+        key : str
+            The key, see `hash_inputs`.
+        fmt : str
+            The file format, such as 'png' or 'pdf'.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the file, which may not exist.
+        """
+        return self.directory / key[:2] / f"{key}.{fmt}"
+
+    def get(self, key: str, fmt: str) -> pathlib.Path | None:
+        """Return the cached file of a key and format, if there is one.
+
+        Parameters
+        ----------
+        key : str
+            The key, see `hash_inputs`.
+        fmt : str
+            The file format, such as 'png' or 'pdf'.
+
+        Returns
+        -------
+        pathlib.Path | None
+            The path of the cached file, or None if it is not cached.
+        """
+        path = self.path(key, fmt)
+        try:
+            # Mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return path
+
+    def put(self, key: str, fmt: str, fig: Figure, **kwargs: Any) -> pathlib.Path:
+        """Save a figure to the cache, replacing any file with the same key.
+
+        Parameters
+        ----------
+        key : str
+            The key, see `hash_inputs`.
+        fmt : str
+            The file format, such as 'png' or 'pdf'.
+        fig : Figure
+            The figure to save.
+        **kwargs : Any
+            Keyword arguments to be passed to `Figure.savefig`.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the cached file.
+        """
+        path = self.path(key, fmt)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = _create_temporary(path.parent, f".{key}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                fig.savefig(f, format=fmt, **kwargs)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+        if self.max_bytes is not None:
+            with self._lock:
+                if self._size is not None:
+                    self._size += path.stat().st_size - replaced
+                size = self._size
+            if size is None or size > self.max_bytes:
+                self.evict(self.max_bytes, keep=path)
+        return path
+
+    @phase("RenderCache.render")
+    def render(
+        self,
+        draw: Callable[..., Figure],
+        *args: Any,
+        fmt: str = "png",
+        savefig_kwargs: dict[str, Any] | None = None,
+        out: str | os.PathLike | None = None,
+        **kwargs: Any,
+    ) -> pathlib.Path:
+        """Return the rendered file of a figure, drawing it only if it is not cached.
+
+        The key is the hash of 'draw', its arguments, the format, 'savefig_kwargs' and
+        the active rcParams, see `hash_inputs`. Any other state that 'draw' depends on
+        is not part of the key.
+
+        Parameters
+        ----------
+        draw : Callable[..., Figure]
+            Creates and returns the figure from 'args' and 'kwargs'. The figure is
+            closed after it has been saved.
+        *args : Any
+            Positional arguments to be passed to 'draw'.
+        fmt : str
+            The file format, such as 'png' or 'pdf'. Default is 'png'.
+        savefig_kwargs : dict[str, Any] | None
+            Keyword arguments to be passed to `Figure.savefig`.
+        out : str | os.PathLike | None
+            Also copy the rendered file to this path.
+        **kwargs : Any
+            Keyword arguments to be passed to 'draw'.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the rendered file, in the cache or 'out' if given.
+        """
+        savefig_kwargs = savefig_kwargs or {}
+        key = hash_inputs(draw, fmt, savefig_kwargs, *args, **kwargs)
+        path = self.get(key, fmt)
+        if path is None:
+            fig = draw(*args, **kwargs)
+            try:
+                path = self.put(key, fmt, fig, **savefig_kwargs)
+            finally:
+                plt.close(fig)
+        if out is None:
+            return path
+        try:
+            shutil.copyfile(path, out)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            fig = draw(*args, **kwargs)
+            try:
+                fig.savefig(out, format=fmt, **savefig_kwargs)
+            finally:
+                plt.close(fig)
+        return pathlib.Path(out)
+
+    def _files(self) -> list[os.DirEntry]:
+        files: list[os.DirEntry] = []
+        for sub in os.scandir(self.directory):
+            if sub.is_dir():
+                files.extend(entry for entry in os.scandir(sub) if entry.is_file())
+        return files
+
+    def evict(self, max_bytes: int, keep: pathlib.Path | None = None) -> int:
+        """Remove the least recently used files until the cache fits in 'max_bytes'.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The largest total size of the files to keep.
+        keep : pathlib.Path | None
+            A file that is never removed, such as the one just written.
+
+        Returns
+        -------
+        int
+            The number of removed files.
+        """
+        now = time.time()
+        files: list[tuple[float, int, str]] = []
+        for entry in self._files():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.endswith(_TMP_SUFFIX):
+                if now - stat.st_mtime > _STALE_SECONDS:
+                    pathlib.Path(entry.path).unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            if keep is not None and path == str(keep):
+                continue
+            # Another process may have removed it already
+            pathlib.Path(path).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._evictions += removed
+            self._size = total
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        self.evict(0)
+
+    def info(self) -> RenderCacheInfo:
+        """Return the cache statistics of this object and the size of the directory.
+
+        Returns
+        -------
+        RenderCacheInfo
+            Named tuple with the number of ``hits``, ``misses`` and ``evictions`` made
+            through this object, and the number of ``files`` and their total ``size``
+            in bytes in the directory.
+        """
+        sizes = []
+        for entry in self._files():
+            if entry.name.endswith(_TMP_SUFFIX):
+                continue
+            try:
+                sizes.append(entry.stat().st_size)
+            except FileNotFoundError:
+                continue
+        with self._lock:
+            return RenderCacheInfo(
+                self._hits, self._misses, self._evictions, len(sizes), sum(sizes)
+            )
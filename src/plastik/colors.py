@@ -1,8 +1,9 @@
 """Module for working with colours."""
 
+import functools
 import inspect
 import sys
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from typing import Literal, overload
 
 import cmcrameri  # noqa
@@ -10,7 +11,8 @@ import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import palettable  # noqa
-import pywaffle
+
+_COLORLIST_CACHE_SIZE = 256
 
 
 @overload
@@ -93,12 +95,95 @@ def create_colorlist(
     But, the project is old (last commit on 19 Nov 2017), so let us do it with
     ``matplotlib.colors`` instead. The results are not identical, but who knows
     which is better.
+
+    Colour lists and colour maps are cached on (``color_specifier``, ``n``, ``map``),
+    see ``colorlist_cache_info``.
     """
     if isinstance(color_specifier, list):
-        return _create_colorlist_between(color_specifier, n, map=map)
+        key: Hashable = tuple(color_specifier)
     elif isinstance(color_specifier, str):
-        return _create_colorlist_from(color_specifier, n, map=map)
-    raise AttributeError("'color_specifier' must be either a list or a string.")
+        key = color_specifier
+    else:
+        raise AttributeError("'color_specifier' must be either a list or a string.")
+    if key == "help":
+        return _create_colorlist_from(key, n, map=map)
+    try:
+        colors = _cached_colorlist(key, n, map)
+    except TypeError:
+        # Colours that cannot be hashed, such as RGB arrays, are not cached.
+        return _create_colorlist_between(color_specifier, n, map=map)
+    # Hand out copies so that callers cannot alter the cached objects
+    if isinstance(colors, mpl.colors.Colormap):
+        return colors.copy()
+    return list(colors)
+
+
+@functools.lru_cache(maxsize=_COLORLIST_CACHE_SIZE)
+def _cached_colorlist(
+    key: Hashable, n: int, map: bool
+) -> tuple[str, ...] | mpl.colors.Colormap:
+    colors: list[str] | mpl.colors.Colormap
+    if isinstance(key, tuple):
+        colors = _create_colorlist_between(key, n, map=map)
+    else:
+        colors = _create_colorlist_from(str(key), n, map=map)
+    return colors if isinstance(colors, mpl.colors.Colormap) else tuple(colors)
+
+
+def colorlist_cache_info() -> functools._CacheInfo:
+    """Return the hit and miss statistics of the ``create_colorlist`` cache.
+
+    Returns
+    -------
+    functools._CacheInfo
+        Named tuple with the number of ``hits`` and ``misses``, the ``maxsize`` and the
+        current size (``currsize``) of the cache.
+
+    Examples
+    --------
+    >>> colorlist_cache_clear()
+    >>> _ = create_colorlist("viridis", 5)
+    >>> _ = create_colorlist("viridis", 5)
+    >>> info = colorlist_cache_info()
+    >>> info.hits, info.misses
+    (1, 1)
+    """
+    return _cached_colorlist.cache_info()
+
+
+def colorlist_cache_clear() -> None:
+    """Clear the ``create_colorlist`` cache and reset its statistics."""
+    _cached_colorlist.cache_clear()
+
+
+def _to_hex(rgba: np.ndarray) -> list[str]:
+    """Convert an (n, 3) or (n, 4) array of RGB(A) floats to HEX strings.
+
+    This gives the same result as calling ``mpl.colors.to_hex`` on each row.
+    """
+    rgb = np.round(np.asarray(rgba)[:, :3] * 255).astype(np.uint32)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    return np.char.mod("#%06x", packed).tolist()
+
+
+def _to_uint8(colors: Sequence[str]) -> np.ndarray:
+    """Convert colours to an (n, 3) array of RGB, or (n, 4) of RGBA, bytes.
+
+    Lists of '#rrggbb' strings, such as from ``create_colorlist``, are decoded in one
+    go. Other colours are converted by ``mpl.colors.to_rgba_array``.
+    """
+    joined = "".join(colors)
+    if len(joined) == 7 * len(colors) and joined[::7] == "#" * len(colors):
+        try:
+            rgb = bytes.fromhex("".join(c[1:] for c in colors))
+        except ValueError:
+            pass
+        else:
+            return np.frombuffer(rgb, dtype=np.uint8).reshape(-1, 3)
+    rgba = mpl.colors.to_rgba_array(colors)
+    if np.all(rgba[:, 3] == 1):
+        rgba = rgba[:, :3]
+    return np.round(rgba * 255).astype(np.uint8)
 
 
 def _create_colorlist_from(
@@ -142,7 +227,7 @@ def _create_colorlist_from(
         sys.exit()
     if map:
         return plt.get_cmap(cmap_name, n)
-    return [mpl.colors.to_hex(c) for c in plt.get_cmap(cmap_name, n)(range(n))]
+    return _to_hex(plt.get_cmap(cmap_name, n)(range(n)))
 
 
 def _create_colorlist_between(
@@ -174,12 +259,9 @@ def _create_colorlist_between(
     """
     if map:
         return mpl.colors.LinearSegmentedColormap.from_list("Custom", colors, N=n)
-    return [
-        mpl.colors.to_hex(c)
-        for c in mpl.colors.LinearSegmentedColormap.from_list("Custom", colors, N=n)(
-            range(n)
-        )
-    ]
+    return _to_hex(
+        mpl.colors.LinearSegmentedColormap.from_list("Custom", colors, N=n)(range(n))
+    )
 
 
 def palettable_help() -> None:
@@ -292,21 +374,19 @@ def make_color_swatch(  # noqa: PLR0913
     >>> plt.show()
     """
     if isinstance(c_bar, list):
-        row_col = "columns" if vertical else "rows"
-        kwarg = {row_col: 1}
-        pywaffle.Waffle.make_waffle(
-            ax=ax,
-            values=[1 for _ in range(len(c_bar))],
-            colors=c_bar,
-            interval_ratio_x=0,
-            interval_ratio_y=0,
-            starting_location="NW",
-            vertical=True,
-            block_arranging_style="snake",
-            tight={"pad": 0},
-            **kwarg,
+        # One pixel per colour, drawn as square blocks from the left, or from the top
+        # when vertical, in the same data coordinates as the former waffle chart
+        n = len(c_bar)
+        swatch = _to_uint8(c_bar)
+        width = 1 / n if vertical else n
+        ax.imshow(
+            swatch[:, np.newaxis] if vertical else swatch[np.newaxis],
+            aspect="auto",
+            interpolation="nearest",
+            extent=(0, width, 0, 1),
         )
-        ax.set_axis_on()
+        ax.set_xlim(0, width)
+        ax.set_ylim(0, 1)
     else:
         gradient = np.linspace(0, 1, resolution)
         if resolution // ratio < 1:
@@ -0,0 +1,168 @@
+"""Reduce the number of samples to what can be seen on screen before plotting."""
+
+import matplotlib as mpl
+import numpy as np
+
+
+def pixel_width(ax: mpl.axes.Axes) -> int:
+    """Return the width of the axes in pixels, at the DPI of its figure.
+
+    Parameters
+    ----------
+    ax : mpl.axes.Axes
+        The axes object the data will be drawn on.
+
+    Returns
+    -------
+    int
+        The number of pixel columns covered by the axes.
+    """
+    return max(1, int(np.ceil(ax.get_window_extent().width)))
+
+
+def n_buckets(ax: mpl.axes.Axes, decimate: bool | int) -> int:
+    """Return the number of buckets to reduce to for a ``decimate`` option.
+
+    Parameters
+    ----------
+    ax : mpl.axes.Axes
+        The axes object the data will be drawn on.
+    decimate : bool | int
+        True to use one bucket per pixel column of 'ax', False to not decimate, or the
+        number of buckets.
+
+    Returns
+    -------
+    int
+        The number of buckets, where zero means no decimation.
+    """
+    return pixel_width(ax) if decimate is True else int(decimate)
+
+
+def _buckets(x: np.ndarray, buckets: int, log: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first and last index of each run of samples in the same bucket.
+
+    The buckets are of equal width along 'x', in log space if 'log' is True. Samples
+    are assumed to be ordered along 'x'; unordered samples only give less reduction.
+    """
+    pos = np.asarray(x, dtype=np.float64)
+    if log:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pos = np.log10(pos)
+    finite = pos[np.isfinite(pos)]
+    lo, hi = (finite.min(), finite.max()) if finite.size else (0.0, 0.0)
+    scale = buckets / (hi - lo) if hi > lo else 0.0
+    bucket = np.nan_to_num((pos - lo) * scale, nan=-1, posinf=-1, neginf=-1)
+    bucket = np.minimum(bucket.astype(np.intp), buckets - 1)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(pos)] - 1
+    return starts, ends
+
+
+def _first_match(
+    values: np.ndarray, targets: np.ndarray, runs: np.ndarray
+) -> np.ndarray:
+    """Return the first index in each run where 'values' equals the run's target."""
+    run = np.repeat(np.arange(len(targets)), runs)
+    candidates = np.flatnonzero(values == np.repeat(targets, runs))
+    _, first = np.unique(run[candidates], return_index=True)
+    return candidates[first]
+
+
+def m4(
+    x: np.ndarray, y: np.ndarray, buckets: int, *, log: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line to the first, last, minimum and maximum sample per bucket.
+
+    With one bucket per pixel column, the reduced line rasterises to the same pixels
+    as the full line (M4 aggregation).
+
+    Parameters
+    ----------
+    x : np.ndarray
+        One dimensional array, x-axis. Should be ordered.
+    y : np.ndarray
+        Values along y-axis, same shape as 'x'.
+    buckets : int
+        The number of buckets along the x-axis, typically the width of the axes in
+        pixels, see ``pixel_width``. Zero returns the data unchanged.
+    log : bool
+        Use buckets of equal width in log space, for a logarithmic x-axis.
+
+    Returns
+    -------
+    np.ndarray
+        The reduced x-values.
+    np.ndarray
+        The reduced y-values.
+
+    Examples
+    --------
+    >>> x = np.linspace(0, 1, 10_000)
+    >>> x_, y_ = m4(x, np.sin(50 * x), 100)
+    >>> len(x_) <= 400
+    True
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if buckets < 1 or len(x) <= 4 * buckets:
+        return x, y
+    starts, ends = _buckets(x, buckets, log)
+    runs = ends - starts + 1
+    keep = np.unique(
+        np.concatenate(
+            (
+                starts,
+                ends,
+                _first_match(y, np.minimum.reduceat(y, starts), runs),
+                _first_match(y, np.maximum.reduceat(y, starts), runs),
+            )
+        )
+    )
+    return x[keep], y[keep]
+
+
+def envelope(
+    x: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    buckets: int,
+    *,
+    log: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce filled bands to the lowest lower edge and highest upper edge per bucket.
+
+    Each bucket is represented by its first and last x-value, and the band never gets
+    narrower than the full resolution band, so nothing that would cover a pixel is
+    lost.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        One dimensional array, x-axis. Should be ordered.
+    lower : np.ndarray
+        Lower edge of the bands, shape (len(x),) or (n, len(x)).
+    upper : np.ndarray
+        Upper edge of the bands, same shape as 'lower'.
+    buckets : int
+        The number of buckets along the x-axis, typically the width of the axes in
+        pixels, see ``pixel_width``. Zero returns the data unchanged.
+    log : bool
+        Use buckets of equal width in log space, for a logarithmic x-axis.
+
+    Returns
+    -------
+    np.ndarray
+        The reduced x-values.
+    np.ndarray
+        The reduced lower edges.
+    np.ndarray
+        The reduced upper edges.
+    """
+    x, lower, upper = np.asarray(x), np.asarray(lower), np.asarray(upper)
+    if buckets < 1 or len(x) <= 2 * buckets:
+        return x, lower, upper
+    starts, ends = _buckets(x, buckets, log)
+    x_out = np.stack((x[starts], x[ends]), axis=-1).ravel()
+    lower_out = np.repeat(np.minimum.reduceat(lower, starts, axis=-1), 2, axis=-1)
+    upper_out = np.repeat(np.maximum.reduceat(upper, starts, axis=-1), 2, axis=-1)
+    return x_out, lower_out, upper_out
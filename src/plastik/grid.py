@@ -1,13 +1,23 @@
 """Create and manipulate grids, similar to sub-figure layouts."""
 
-import itertools
-from typing import Any, Literal
+import collections
+import functools
+import threading
+from collections.abc import Hashable
+from typing import Any, Literal, NamedTuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
+from matplotlib.text import Text
 from typing_extensions import Self
 
+from plastik.profiling import phase
+
+# The number of distinct layouts whose geometry is kept
+_GEOMETRY_CACHE_SIZE = 256
+
 
 class FigureGrid:
     """Return a figure with axes appropriate for (rows, columns) sub-figures.
@@ -70,54 +80,32 @@ class FigureGrid:
             self.using(**using)
         return self.get_grid(**kwargs)
 
+    def _geometry(self: Self) -> "_Geometry":
+        return _geometry(
+            self.rows,
+            self.columns,
+            self._share_axes,
+            self._expand_top,
+            self._columns_first,
+        )
+
     def _calculate_figsize(self: Self) -> tuple[float, float]:
         """Calculate the figure size based on the number of rows and columns."""
-        full_cols = 3.37 * self.columns
-        squash_cols = 3.37 * self.columns - (self.columns - 1) * 3.37 * 0.25
-        full_rows = 2.08277 * self.rows
-        squash_rows = 2.08277 * self.rows - (self.rows - 1) * 2.08277 * 0.25
-        match self._share_axes:
-            case False:
-                return full_rows, full_cols
-            case "x":
-                return squash_rows, full_cols
-            case "y":
-                return full_rows, squash_cols
-            case True | "both":
-                return squash_rows, squash_cols
-            case _:
-                raise ValueError(f"Unknown value for share_axes: {self._share_axes}")
+        return _figsize(self.rows, self.columns, self._share_axes)
 
     def _update_labels(self: Self) -> list[str]:
-        labels = (
-            [
-                rf"$\mathrm{{({chr(97 + ell)})}}$"
-                for ell in range(self.rows * self.columns)
-            ]
-            if not self._labels or len(self._labels) != int(self.rows * self.columns)
-            else self._labels.copy()
-        )
-        return self._maybe_columns_first(labels)
+        if not self._labels or len(self._labels) != int(self.rows * self.columns):
+            return list(self._geometry().labels)
+        return self._maybe_columns_first(self._labels)
 
     def _maybe_columns_first(
         self: Self, list_: list, *, transpose: bool = True
     ) -> list:
         if not self._columns_first:
-            return list_
-        if transpose:
-            list_ = [
-                list_[i * self.rows + j]
-                for j in range(self.rows)
-                for i in range(self.columns)
-            ]
-            return list_
-        grid = [
-            list_[i * self.columns : (i + 1) * self.columns] for i in range(self.rows)
-        ]
-        return [
-            grid[row][col]
-            for col, row in itertools.product(range(self.columns), range(self.rows))
-        ]
+            return list(list_)
+        geometry = self._geometry()
+        order = geometry.label_order if transpose else geometry.axes_order
+        return [list_[i] for i in order]
 
     def using(  # noqa: PLR0913
         self: Self,
@@ -167,15 +155,57 @@ class FigureGrid:
         self._adjust_ylabel = adjust_ylabel or self._adjust_ylabel
         return self
 
+    def template(self: Self, **kwargs: Any) -> "GridTemplate":
+        """Return a factory of new figures with the current layout and properties.
+
+        The layout is computed once, so each call to the template only has to create
+        the figure and its axes. Changing this object afterwards does not change the
+        template.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Additional keyword arguments to be passed to `Axes.text`.
+
+        Returns
+        -------
+        GridTemplate
+            Call it to get a new figure and its axes, like from `get_grid`.
+
+        Examples
+        --------
+        >>> import matplotlib.pyplot as plt
+        >>> new_grid = FigureGrid(2, 3).using(share_axes="x").template()
+        >>> fig, axs = new_grid()
+        >>> len(axs)
+        6
+        >>> plt.close(fig)
+        """
+        return GridTemplate(
+            self._geometry(),
+            tuple(self._update_labels()),
+            self._pos,
+            self._share_axes,
+            self._adjust_ylabel,
+            kwargs,
+        )
+
+    @phase("FigureGrid.get_grid")
     def get_grid(
         self: Self,
-        **kwargs: dict,
+        *,
+        pyplot: bool = True,
+        **kwargs: Any,
     ) -> tuple[Figure, list[Axes]]:
         """Return a figure with axes appropriate for (rows, columns) sub-figures.
 
         Parameters
         ----------
-        **kwargs : dict
+        pyplot : bool
+            Create the figure with `plt.figure`. If False, a bare `Figure` is created
+            that is not tracked by pyplot, which is safe to use from several threads and
+            is freed as soon as it is no longer referenced. Default is True.
+        **kwargs : Any
             Additional keyword arguments to be passed to Axes.text.
 
         Returns
@@ -185,47 +215,483 @@ class FigureGrid:
         list[Axes]
             A list of all the axes objects owned by the figure
         """
-        full_height, full_width = self._calculate_figsize()
-        fig = plt.figure(figsize=(full_width, full_height * self._expand_top))
-        axes = []
-        labels = self._update_labels()
-        for r in range(self.rows):
-            if self._share_axes in {"x", "both", True}:
-                rel_height = 0.75 + 0.25 / self.rows / self._expand_top
-                height = 0.75 / self.rows / rel_height / self._expand_top
-                bottom_pad = 0.2 / self.rows / rel_height / self._expand_top
-                bottom = bottom_pad + height * (self.rows - 1 - r)
+        return self.template(**kwargs)(pyplot=pyplot)
+
+
+class GridTemplate(NamedTuple):
+    """A figure layout from `FigureGrid.template` that creates new figures on call."""
+
+    geometry: "_Geometry"
+    labels: tuple[str, ...]
+    pos: tuple[float, float]
+    share_axes: Literal["x", "y", "both"] | bool
+    adjust_ylabel: float
+    text_kwargs: dict[str, Any]
+
+    def __call__(self, *, pyplot: bool = True) -> tuple[Figure, list[Axes]]:
+        """Create a new figure with the axes of the template.
+
+        Parameters
+        ----------
+        pyplot : bool
+            Create the figure with `plt.figure`. If False, a bare `Figure` is created
+            that is not tracked by pyplot. Default is True.
+
+        Returns
+        -------
+        Figure
+            The figure object
+        list[Axes]
+            A list of all the axes objects owned by the figure
+        """
+        figsize = self.geometry.figsize
+        fig = plt.figure(figsize=figsize) if pyplot else Figure(figsize=figsize)
+        axes = [
+            self._setup_axes(fig.add_axes(tuple(rect)), i)
+            for i, rect in enumerate(self.geometry.rects)
+        ]
+        return fig, [axes[i] for i in self.geometry.axes_order]
+
+    def _setup_axes(self, ax: Axes, i: int) -> Axes:
+        """Apply the tick labels, sub-figure label and y-label position to axes 'i'."""
+        rows, columns = self.geometry.shape
+        r, c = divmod(i, columns)
+        if self.share_axes in {"x", "both", True} and r != rows - 1:
+            ax.set_xticklabels([])
+        if self.share_axes in {"y", "both", True} and c != 0:
+            ax.set_yticklabels([])
+        ax.text(
+            self.pos[0],
+            self.pos[1],
+            self.labels[i],
+            transform=ax.transAxes,
+            **self.text_kwargs,
+        )
+        ax.yaxis.set_label_coords(self.adjust_ylabel, 0.5, transform=ax.transAxes)
+        return ax
+
+
+class PoolInfo(NamedTuple):
+    """Statistics of a `FigurePool`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    idle: int
+    in_use: int
+
+
+class _Pooled(NamedTuple):
+    template: GridTemplate
+    key: Hashable
+    fig: Figure
+    # The axes in the order they were created, and in the order they are returned
+    created: list[Axes]
+    axes: list[Axes]
+    # The sub-figure label and the tick locators and formatters of each axes
+    labels: list[Text]
+    tickers: list[tuple[Any, ...]]
+    # The margins and face colour of each axes, and the face colour of the figure
+    margins: list[tuple[float, float]]
+    facecolors: list[Any]
+    dpi: float
+
+
+class FigurePool:
+    """Hand out figure grids, reusing figures that have been released.
+
+    Creating the axes is the main cost of `figure_grid`. A figure from the pool is
+    instead given back with `release` (or `savefig`) when it is no longer needed, after
+    which it is reset and handed out again for the next request with the same layout
+    and properties.
+
+    A reset removes all artists, legends, titles, axis labels and axes that were added
+    to the figure, and restores the position, limits, autoscaling, margins, face colour,
+    property cycle, scales and tick locators and formatters of each axes, as well as
+    the size, DPI and face colour of the figure. Other changes, such as tick
+    parameters, grid lines and spine settings, are kept. Figures where axes have been
+    shared, for example with `Axes.sharex`, are not reused.
+
+    Parameters
+    ----------
+    maxsize : int
+        The largest number of released figures to keep, which bounds the memory used by
+        the pool. The least recently released figure is dropped first. Default is 16.
+    pyplot : bool
+        Create the figures with `plt.figure`. Default is False, which creates bare
+        figures that pyplot does not track, and therefore cannot be closed by
+        `plt.close("all")` while in the pool.
+
+    Examples
+    --------
+    >>> import io
+    >>> pool = FigurePool(maxsize=4)
+    >>> for i in range(3):
+    ...     fig, axs = pool(1, 2, {"share_axes": "y"})
+    ...     _ = axs[0].plot([0, i])
+    ...     pool.savefig(fig, io.BytesIO(), format="png")
+    >>> info = pool.info()
+    >>> info.hits, info.misses, info.idle
+    (2, 1, 1)
+    """
+
+    def __init__(self, maxsize: int = 16, *, pyplot: bool = False) -> None:
+        if maxsize < 0:
+            raise ValueError(f"'maxsize' must be non-negative, got {maxsize}.")
+        self.maxsize = maxsize
+        self.pyplot = pyplot
+        self._idle: collections.OrderedDict[int, _Pooled] = collections.OrderedDict()
+        self._in_use: dict[int, _Pooled] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __call__(
+        self,
+        rows: int,
+        columns: int,
+        using: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> tuple[Figure, list[Axes]]:
+        """Return a figure with sub-figures in the given layout, from the pool if possible.
+
+        Parameters
+        ----------
+        rows : int
+            The number of rows in the figure.
+        columns : int
+            The number of columns in the figure.
+        using : dict[str, Any] | None
+            The properties to be used for the sub-figures, see `FigureGrid.using`.
+        **kwargs : Any
+            Additional keyword arguments to be passed to `Axes.text`.
+
+        Returns
+        -------
+        Figure
+            A figure object, to be given back with `release` or `savefig`.
+        list[Axes]
+            A list of all the axes objects owned by the figure.
+        """
+        grid = FigureGrid(rows, columns)
+        if using is not None:
+            grid.using(**using)
+        template = grid.template(**kwargs)
+        key = (
+            rows,
+            columns,
+            grid._share_axes,
+            grid._expand_top,
+            grid._columns_first,
+            template.labels,
+            template.pos,
+            template.adjust_ylabel,
+            repr(sorted(kwargs.items())),
+        )
+        with self._lock:
+            entry = next(
+                (e for e in reversed(self._idle.values()) if e.key == key), None
+            )
+            if entry is not None:
+                del self._idle[id(entry.fig)]
+                self._hits += 1
             else:
-                bottom_pad = 0.2 / self.rows
-                height = 0.75 / self.rows / self._expand_top
-                bottom = bottom_pad + (self.rows - 1 - r) / self.rows / self._expand_top
-            for c in range(self.columns):
-                if self._share_axes in {"y", "both", True}:
-                    rel_width = 0.75 + 0.25 / self.columns
-                    width = 0.75 / self.columns / rel_width
-                    left_pad = 0.2 / self.columns / rel_width
-                    left = left_pad + width * c
-                else:
-                    left_pad = 0.2 / self.columns
-                    width = 0.75 / self.columns
-                    left = left_pad + c / self.columns
-                axes.append(fig.add_axes((left, bottom, width, height)))
-                if self._share_axes in {"x", "both", True} and r != self.rows - 1:
-                    axes[-1].set_xticklabels([])
-                if self._share_axes in {"y", "both", True} and c != 0:
-                    axes[-1].set_yticklabels([])
-                axes[-1].text(
-                    self._pos[0],
-                    self._pos[1],
-                    labels[self.columns * r + c],
-                    transform=axes[-1].transAxes,
-                    **kwargs,
-                )
-                axes[-1].yaxis.set_label_coords(
-                    self._adjust_ylabel, 0.5, transform=axes[-1].transAxes
+                self._misses += 1
+        if entry is None:
+            entry = self._create(template, key)
+        with self._lock:
+            self._in_use[id(entry.fig)] = entry
+        return entry.fig, list(entry.axes)
+
+    def _create(self, template: GridTemplate, key: Hashable) -> _Pooled:
+        fig, axes = template(pyplot=self.pyplot)
+        created = [axes[i] for i in np.argsort(template.geometry.axes_order)]
+        return _Pooled(
+            template,
+            key,
+            fig,
+            created,
+            axes,
+            [ax.texts[0] for ax in created],
+            [
+                (
+                    axis.get_major_locator(),
+                    axis.get_major_formatter(),
+                    axis.get_minor_locator(),
+                    axis.get_minor_formatter(),
                 )
-        axes = self._maybe_columns_first(axes, transpose=False)
-        return fig, axes
+                for ax in created
+                for axis in (ax.xaxis, ax.yaxis)
+            ],
+            [ax.margins() for ax in created],
+            [fig.get_facecolor(), *(ax.get_facecolor() for ax in created)],
+            fig.get_dpi(),
+        )
+
+    def release(self, fig: Figure) -> None:
+        """Reset a figure from the pool and make it available for reuse.
+
+        Parameters
+        ----------
+        fig : Figure
+            A figure handed out by this pool, which should not be used afterwards.
+
+        Raises
+        ------
+        ValueError
+            If the figure is not in use from this pool.
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(fig), None)
+        if entry is None:
+            raise ValueError("The figure is not in use from this pool.")
+        if self.maxsize == 0 or _is_shared(entry):
+            # Shared axes cannot be reliably unshared, so such figures are not reused
+            self._discard(entry)
+            with self._lock:
+                self._evictions += 1
+            return
+        _reset(entry)
+        with self._lock:
+            self._idle[id(fig)] = entry
+            evicted = []
+            while len(self._idle) > self.maxsize:
+                evicted.append(self._idle.popitem(last=False)[1])
+                self._evictions += 1
+        for old in evicted:
+            self._discard(old)
+
+    def savefig(self, fig: Figure, fname: Any, **kwargs: Any) -> None:
+        """Save a figure from the pool and release it.
+
+        Parameters
+        ----------
+        fig : Figure
+            A figure handed out by this pool.
+        fname : Any
+            The file to save to, see `Figure.savefig`.
+        **kwargs : Any
+            Additional keyword arguments to be passed to `Figure.savefig`.
+        """
+        try:
+            fig.savefig(fname, **kwargs)
+        finally:
+            self.release(fig)
+
+    def info(self) -> PoolInfo:
+        """Return the number of reused and created figures, and the pool size.
+
+        Returns
+        -------
+        PoolInfo
+            Named tuple with the number of requests served from the pool (``hits``) and
+            by creating a figure (``misses``), the number of released figures that were
+            dropped (``evictions``), and the number of figures in the pool (``idle``)
+            and handed out (``in_use``).
+        """
+        with self._lock:
+            return PoolInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._idle),
+                len(self._in_use),
+            )
+
+    def clear(self) -> None:
+        """Drop all released figures from the pool."""
+        with self._lock:
+            idle = list(self._idle.values())
+            self._idle.clear()
+        for entry in idle:
+            self._discard(entry)
+
+    def _discard(self, entry: _Pooled) -> None:
+        if self.pyplot:
+            plt.close(entry.fig)
+
+
+def _is_shared(entry: _Pooled) -> bool:
+    """Return whether any axes of a pooled figure has been shared with another."""
+    return any(
+        len(grouper.get_siblings(ax)) > 1
+        for ax in entry.fig.axes
+        for grouper in (ax.get_shared_x_axes(), ax.get_shared_y_axes())
+    )
+
+
+def _reset(entry: _Pooled) -> None:
+    """Undo the changes made to a pooled figure since it was created."""
+    fig = entry.fig
+    for ax in fig.axes:
+        if ax not in entry.created:
+            fig.delaxes(ax)
+    for artist in (*fig.legends, *fig.lines, *fig.patches, *fig.images, *fig.artists):
+        artist.remove()
+    sup = {fig.suptitle(""), fig.supxlabel(""), fig.supylabel("")}
+    for text in fig.texts[:]:
+        if text not in sup:
+            text.remove()
+    fig.set_size_inches(entry.template.geometry.figsize)
+    fig.set_dpi(entry.dpi)
+    fig.set_facecolor(entry.facecolors[0])
+    tickers = iter(entry.tickers)
+    for ax, label, rect, margins, facecolor in zip(
+        entry.created,
+        entry.labels,
+        entry.template.geometry.rects,
+        entry.margins,
+        entry.facecolors[1:],
+        strict=True,
+    ):
+        # Colorbars shrink the axes they are attached to
+        ax.set_position(tuple(rect))
+        for artist in (
+            *ax.lines,
+            *ax.collections,
+            *ax.patches,
+            *ax.images,
+            *ax.tables,
+            *ax.artists,
+            *ax.texts,
+        ):
+            if artist is not label:
+                artist.remove()
+        if ax.legend_ is not None:
+            ax.legend_.remove()
+        for loc in ("left", "center", "right"):
+            ax.set_title("", loc=loc)
+        ax.set_xlabel("")
+        ax.set_ylabel("")
+        ax.set_aspect("auto")
+        # Start the colours and other properties from the beginning of the cycle
+        ax.set_prop_cycle(None)
+        ax.margins(*margins)
+        ax.set_facecolor(facecolor)
+        for axis, set_scale in ((ax.xaxis, ax.set_xscale), (ax.yaxis, ax.set_yscale)):
+            if axis.get_scale() != "linear":
+                set_scale("linear")
+            major_locator, major_formatter, minor_locator, minor_formatter = next(
+                tickers
+            )
+            axis.set_major_locator(major_locator)
+            axis.set_major_formatter(major_formatter)
+            axis.set_minor_locator(minor_locator)
+            axis.set_minor_formatter(minor_formatter)
+        ax.relim()
+        ax.set_xlim(0, 1, auto=True)
+        ax.set_ylim(0, 1, auto=True)
+
+
+class _Geometry(NamedTuple):
+    figsize: tuple[float, float]
+    shape: tuple[int, int]
+    # One (left, bottom, width, height) row per axes, in row-major order
+    rects: np.ndarray
+    labels: tuple[str, ...]
+    # Index of the label in each row-major position, and of the axes in each
+    # position of the returned list
+    label_order: tuple[int, ...]
+    axes_order: tuple[int, ...]
+
+
+def _figsize(
+    rows: int, columns: int, share_axes: Literal["x", "y", "both"] | bool
+) -> tuple[float, float]:
+    full_cols = 3.37 * columns
+    squash_cols = 3.37 * columns - (columns - 1) * 3.37 * 0.25
+    full_rows = 2.08277 * rows
+    squash_rows = 2.08277 * rows - (rows - 1) * 2.08277 * 0.25
+    match share_axes:
+        case False:
+            return full_rows, full_cols
+        case "x":
+            return squash_rows, full_cols
+        case "y":
+            return full_rows, squash_cols
+        case True | "both":
+            return squash_rows, squash_cols
+        case _:
+            raise ValueError(f"Unknown value for share_axes: {share_axes}")
+
+
+@functools.lru_cache(maxsize=_GEOMETRY_CACHE_SIZE)
+def _geometry(
+    rows: int,
+    columns: int,
+    share_axes: Literal["x", "y", "both"] | bool,
+    expand_top: float,
+    columns_first: bool,
+) -> _Geometry:
+    """Compute the layout of a grid, shared by all figures with the same layout."""
+    full_height, full_width = _figsize(rows, columns, share_axes)
+    r = np.arange(rows)
+    if share_axes in {"x", "both", True}:
+        rel_height = 0.75 + 0.25 / rows / expand_top
+        height = 0.75 / rows / rel_height / expand_top
+        bottom_pad = 0.2 / rows / rel_height / expand_top
+        bottom = bottom_pad + height * (rows - 1 - r)
+    else:
+        bottom_pad = 0.2 / rows
+        height = 0.75 / rows / expand_top
+        bottom = bottom_pad + (rows - 1 - r) / rows / expand_top
+    c = np.arange(columns)
+    if share_axes in {"y", "both", True}:
+        rel_width = 0.75 + 0.25 / columns
+        width = 0.75 / columns / rel_width
+        left_pad = 0.2 / columns / rel_width
+        left = left_pad + width * c
+    else:
+        left_pad = 0.2 / columns
+        width = 0.75 / columns
+        left = left_pad + c / columns
+    rects = np.empty((rows, columns, 4))
+    rects[..., 0] = left[np.newaxis, :]
+    rects[..., 1] = bottom[:, np.newaxis]
+    rects[..., 2] = width
+    rects[..., 3] = height
+    rects = rects.reshape(-1, 4)
+    rects.flags.writeable = False
+    index = np.arange(rows * columns)
+    if columns_first:
+        label_order = tuple(index.reshape(columns, rows).T.ravel().tolist())
+        axes_order = tuple(index.reshape(rows, columns).T.ravel().tolist())
+    else:
+        label_order = axes_order = tuple(index.tolist())
+    labels = tuple(rf"$\mathrm{{({chr(97 + i)})}}$" for i in label_order)
+    return _Geometry(
+        (full_width, full_height * expand_top),
+        (rows, columns),
+        rects,
+        labels,
+        label_order,
+        axes_order,
+    )
+
+
+def geometry_cache_info() -> functools._CacheInfo:
+    """Return the hit and miss statistics of the cached grid layouts.
+
+    Returns
+    -------
+    functools._CacheInfo
+        The cache statistics, see `functools.lru_cache`.
+    """
+    return _geometry.cache_info()
+
+
+def geometry_cache_clear() -> None:
+    """Clear the cached grid layouts."""
+    _geometry.cache_clear()
 
 
 figure_grid = FigureGrid()
+
+__all__ = [
+    "FigureGrid",
+    "FigurePool",
+    "GridTemplate",
+    "PoolInfo",
+    "figure_grid",
+    "geometry_cache_clear",
+    "geometry_cache_info",
+]
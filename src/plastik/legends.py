@@ -1,26 +1,202 @@
 """Manipulate the legend of a matplotlib figure."""
 
+from collections.abc import Hashable, Iterable, Sequence
 from typing import Any, Literal
 
 import matplotlib as mpl
 import numpy as np
 
+from plastik.profiling import phase
 
+_Side = Literal[
+    "top",
+    "bottom",
+    "right",
+    "left",
+    "top right",
+    "top left",
+    "bottom right",
+    "bottom left",
+]
+_Loc = Literal[
+    "upper center",
+    "lower center",
+    "center right",
+    "center left",
+    "upper right",
+    "upper left",
+    "lower right",
+    "lower left",
+]
+_SIDES: dict[str, _Loc] = {
+    "top": "upper center",
+    "bottom": "lower center",
+    "right": "center right",
+    "left": "center left",
+    "top right": "upper right",
+    "top left": "upper left",
+    "bottom right": "lower right",
+    "bottom left": "lower left",
+}
+_ANCHORS = {
+    "top": (0.5, 1.05),
+    "bottom": (0.5, -0.05),
+    "right": (1.04, 0.5),
+    "left": (-0.04, 0.5),
+    "top right": (1.04, 1.05),
+    "top left": (-0.04, 1.05),
+    "bottom right": (1.04, -0.05),
+    "bottom left": (-0.04, -0.05),
+}
+
+# The properties of a legend handle that decide how its legend entry looks
+_STYLE_PROPERTIES = (
+    "color",
+    "facecolor",
+    "edgecolor",
+    "markerfacecolor",
+    "markeredgecolor",
+    "linestyle",
+    "linewidth",
+    "marker",
+    "markersize",
+    "hatch",
+    "alpha",
+)
+_COLOR_PROPERTIES = {
+    "color",
+    "facecolor",
+    "edgecolor",
+    "markerfacecolor",
+    "markeredgecolor",
+}
+
+
+def _n_columns(n_labels: int, c_max: int) -> int:
+    """Return the fewest columns that fit the labels in the fewest rows.
+
+    With at most 'c_max' columns, the labels need ``ceil(n_labels / c_max)`` rows, and
+    the smallest number of columns that fill those rows is found the same way.
+    """
+    n_row = -(-n_labels // c_max)
+    return max(-(-n_labels // n_row), 1) if n_row else 1
+
+
+def _handles_labels(
+    ax: mpl.axes.Axes, args: tuple[Any, ...]
+) -> tuple[Sequence[Any] | None, list[str]]:
+    """Return the handles and labels of the legend, without creating it.
+
+    The handles are None if the labels should be given to the artists of the axes in
+    order, as with ``ax.legend(labels)``.
+    """
+    if args and isinstance(args[0][0], str):
+        raise ValueError(
+            "The first args parameter must be a sequence of Artist, not str."
+        )
+    less_than_two = 2
+    if len(args) >= less_than_two:
+        return list(args[0]), list(args[1])
+    legend: mpl.legend.Legend | None = ax.get_legend()
+    if legend is not None:
+        # If the labels are defined directly in the legend as a list, calling
+        # ax.legend() will re-set it to an empty legend. Therefore, we grab the list
+        # and re-set it when we update the legend object.
+        labels = [text.get_text() for text in legend.texts]
+        return (list(args[0]) if args else None), labels
+    if args:
+        handles = list(args[0])
+        return handles, [handle.get_label() for handle in handles]
+    # The labels are set when creating the artists, as ax.legend() would find them
+    handles, labels = ax.get_legend_handles_labels()
+    return handles, labels
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, np.ndarray):
+        return value.shape, value.tobytes()
+    if isinstance(value, list | tuple):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _style_key(handle: Any) -> Hashable:
+    """Return the type and the legend relevant style properties of a handle.
+
+    Colours are compared as RGBA, so that for example 'C0' and its hex code are equal.
+    """
+    key: list[Any] = [type(handle)]
+    for prop in _STYLE_PROPERTIES:
+        getter = getattr(handle, f"get_{prop}", None)
+        if getter is None:
+            continue
+        value = getter()
+        if prop in _COLOR_PROPERTIES:
+            try:
+                value = mpl.colors.to_rgba_array(value)
+            except (TypeError, ValueError):
+                pass
+        key.append(_hashable(value))
+    return tuple(key)
+
+
+def _place_legend(  # noqa: PLR0913
+    ax: mpl.axes.Axes | mpl.figure.Figure,
+    handles: Sequence[Any] | None,
+    labels: list[str],
+    n_col: int,
+    *,
+    alpha: float,
+    side: _Side,
+    edgecolor: str | tuple[float, float, float],
+    facecolor: str | tuple[float, float, float],
+    anchor_: tuple[float, float] | None,
+    transform: mpl.transforms.Transform | None = None,
+    **kwargs: Any,
+) -> mpl.legend.Legend:
+    """Create the legend of an axes or figure, with the anchor relative to 'transform'.
+
+    The transform defaults to the axes coordinates of 'ax'.
+    """
+    edgecolor = kwargs.pop("ec", edgecolor)
+    facecolor = kwargs.pop("fc", facecolor)
+    loc, anchor = _SIDES[side], anchor_ or _ANCHORS[side]
+    if transform is None:
+        transform = ax.transAxes  # type: ignore[union-attr]
+    if handles is None:
+        leg = ax.legend(
+            labels,
+            loc=loc,
+            bbox_to_anchor=anchor,
+            bbox_transform=transform,
+            ncol=n_col,
+            **kwargs,
+        )
+    else:
+        leg = ax.legend(
+            handles,
+            labels,
+            loc=loc,
+            bbox_to_anchor=anchor,
+            bbox_transform=transform,
+            ncol=n_col,
+            **kwargs,
+        )
+    if facecolor:
+        leg.get_frame().set_facecolor(facecolor)
+    if edgecolor:
+        leg.get_frame().set_edgecolor(edgecolor)
+    leg.get_frame().set_alpha(alpha)
+    return leg
+
+
+@phase("topside_legends")
 def topside_legends(  # noqa: PLR0913
     ax: mpl.axes.Axes,
     *args: Any,
     c_max: int = 4,
     alpha: float = 0.8,
-    side: Literal[
-        "top",
-        "bottom",
-        "right",
-        "left",
-        "top right",
-        "top left",
-        "bottom right",
-        "bottom left",
-    ] = "top",
+    side: _Side = "top",
     edgecolor: str | tuple[float, float, float] = "",
     facecolor: str | tuple[float, float, float] = "",
     anchor_: tuple[float, float] | None = None,
@@ -71,91 +247,196 @@ def topside_legends(  # noqa: PLR0913
     ------
     ValueError
         If the first parameter is a string type (should be an axis Artist).
+
+    Examples
+    --------
+    Five labels and at most four columns give two rows of three columns, rather than
+    a row of four and a row of one:
+
+    >>> import matplotlib.pyplot as plt
+    >>> fig, ax = plt.subplots()
+    >>> _ = [ax.plot([0, i], label=f"line {i}") for i in range(5)]
+    >>> ax = topside_legends(ax, c_max=4)
+    >>> fig.canvas.draw()
+    >>> len({text.get_window_extent().x0 for text in ax.get_legend().get_texts()})
+    3
+    >>> plt.close(fig)
     """
-    _sides = {
-        "top": "upper center",
-        "bottom": "lower center",
-        "right": "center right",
-        "left": "center left",
-        "top right": "upper right",
-        "top left": "upper left",
-        "bottom right": "lower right",
-        "bottom left": "lower left",
-    }
-    _anchors = {
-        "top": (0.5, 1.05),
-        "bottom": (0.5, -0.05),
-        "right": (1.04, 0.5),
-        "left": (-0.04, 0.5),
-        "top right": (1.04, 1.05),
-        "top left": (-0.04, 1.05),
-        "bottom right": (1.04, -0.05),
-        "bottom left": (-0.04, -0.05),
-    }
-    loc = _sides[side]
-    edgecolor = kwargs.pop("ec", edgecolor)
-    facecolor = kwargs.pop("fc", facecolor)
-    anchor = anchor_ or _anchors[side]
-    if args and isinstance(args[0][0], str):
-        raise ValueError(
-            "The first args parameter must be a sequence of Artist, not str."
-        )
-    less_than_two = 2
-    if len(args) < less_than_two:
-        try:
-            # If the labels are defined directly in the legend as a list, calling
-            # ax.legend() will re-set it to an empty legend. Therefore, we grab the list
-            # and re-set it when we update the legend object.
-            legend1: mpl.legend.Legend = ax.get_legend()
-            lst = [l_.get_text() for l_ in legend1.get_texts()]
-            l_d = len(legend1.get_texts())
-        except AttributeError:
-            # If, however, the labels are set when creating the lines objects (e.g.
-            # ax.plot(x, y, label="Label for (x, y) data")), we first make sure the
-            # legend object is created by calling ax.legend(), then we check how many
-            # labels exist in it. Calling ax.legend() will in this case preserve all
-            # labels.
-            ax.legend()
-            legend2: mpl.legend.Legend = ax.get_legend()
-            lst = []  # The empty list is falsy.
-            l_d = len(legend2.get_texts())
-    else:
-        lst = list(args[1])
-        l_d = len(args[1])
-    n_row = int(np.ceil(l_d / c_max))
-    n_col = 1
-    while l_d > n_col * n_row:
-        n_col += 1
-    if args:
-        leg = ax.legend(
-            args[0],
-            lst,
-            loc=loc,
-            bbox_to_anchor=anchor,
-            bbox_transform=ax.transAxes,
-            ncol=n_col,
-            **kwargs,
-        )
-    elif lst:
-        leg = ax.legend(
-            lst,
-            loc=loc,
-            bbox_to_anchor=anchor,
-            bbox_transform=ax.transAxes,
-            ncol=n_col,
-            **kwargs,
-        )
-    else:
-        leg = ax.legend(
-            loc=loc,
-            bbox_to_anchor=anchor,
-            bbox_transform=ax.transAxes,
-            ncol=n_col,
-            **kwargs,
-        )
-    if facecolor:
-        leg.get_frame().set_facecolor(facecolor)
-    if edgecolor:
-        leg.get_frame().set_edgecolor(edgecolor)
-    leg.get_frame().set_alpha(alpha)
+    handles, labels = _handles_labels(ax, args)
+    _place_legend(
+        ax,
+        handles,
+        labels,
+        _n_columns(len(labels), c_max),
+        alpha=alpha,
+        side=side,
+        edgecolor=edgecolor,
+        facecolor=facecolor,
+        anchor_=anchor_,
+        **kwargs,
+    )
     return ax
+
+
+@phase("topside_legends_many")
+def topside_legends_many(  # noqa: PLR0913
+    axes: Iterable[mpl.axes.Axes],
+    *,
+    c_max: int = 4,
+    alpha: float = 0.8,
+    side: _Side = "top",
+    edgecolor: str | tuple[float, float, float] = "",
+    facecolor: str | tuple[float, float, float] = "",
+    anchor_: tuple[float, float] | None = None,
+    **kwargs: Any,
+) -> list[mpl.axes.Axes]:
+    """Move the legends of many axes, such as from `figure_grid`, in one pass.
+
+    All legends are placed at the same side and get the same number of columns, given
+    by the axes with the most labels. Axes without any labels are left without a
+    legend. See `topside_legends` for the parameters.
+
+    Parameters
+    ----------
+    axes : Iterable[mpl.axes.Axes]
+        The axes objects, which may also be a (nested) array of them.
+    c_max : int
+        Total number of columns allowed. Defaults to 4.
+    alpha : float
+        Alpha value for the background of the legends. Defaults to 0.8.
+    side : Literal['top', 'bottom', 'right', 'left', 'top right', 'top left', 'bottom right', 'bottom left']
+        Places the legends at the given side. Defaults to 'top'.
+    edgecolor : str | tuple[float, float, float]
+        Set the colour of the legend edges. Can also be set with the alias 'ec'.
+    facecolor : str | tuple[float, float, float]
+        Set the colour of the legend faces. Can also be set with the alias 'fc'.
+    anchor_ : tuple[float, float] | None, optional
+        A custom location of the legends, see `topside_legends`.
+    **kwargs : Any
+        All keyword arguments are sent to ax.legend().
+
+    Returns
+    -------
+    list[mpl.axes.Axes]
+        The axes objects, flattened.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import plastik
+    >>> fig, axs = plastik.figure_grid(1, 2)
+    >>> for i, ax in enumerate(axs):
+    ...     _ = [ax.plot([0, j], label=f"line {j}") for j in range(i + 3)]
+    >>> axs = topside_legends_many(axs, c_max=3)
+    >>> fig.canvas.draw()
+    >>> [
+    ...     len({text.get_window_extent().x0 for text in ax.get_legend().get_texts()})
+    ...     for ax in axs
+    ... ]
+    [2, 2]
+    >>> plt.close(fig)
+    """
+    axes_ = list(np.ravel(np.asarray(axes, dtype=object)))
+    entries = [_handles_labels(ax, ()) for ax in axes_]
+    n_col = _n_columns(max((len(labels) for _, labels in entries), default=0), c_max)
+    for ax, (handles, labels) in zip(axes_, entries, strict=True):
+        if labels:
+            _place_legend(
+                ax,
+                handles,
+                labels,
+                n_col,
+                alpha=alpha,
+                side=side,
+                edgecolor=edgecolor,
+                facecolor=facecolor,
+                anchor_=anchor_,
+                **kwargs,
+            )
+    return axes_
+
+
+@phase("figure_legend")
+def figure_legend(  # noqa: PLR0913
+    fig: mpl.figure.Figure,
+    axes: Iterable[mpl.axes.Axes] | None = None,
+    *,
+    side: _Side = "top",
+    c_max: int = 4,
+    alpha: float = 0.8,
+    edgecolor: str | tuple[float, float, float] = "",
+    facecolor: str | tuple[float, float, float] = "",
+    anchor_: tuple[float, float] | None = None,
+    **kwargs: Any,
+) -> mpl.legend.Legend:
+    """Create one legend for the figure, with the distinct entries of all axes.
+
+    Handles with the same label and style, such as the same series drawn in every
+    panel of a `figure_grid`, are only shown once. The legend is placed as by
+    `topside_legends`, with the side and anchor relative to the box around all the
+    axes instead of a single one.
+
+    Parameters
+    ----------
+    fig : mpl.figure.Figure
+        The figure to add the legend to.
+    axes : Iterable[mpl.axes.Axes] | None, optional
+        The axes to collect the legend entries from, which may also be a (nested)
+        array of them. Defaults to all axes of the figure.
+    side : Literal['top', 'bottom', 'right', 'left', 'top right', 'top left', 'bottom right', 'bottom left']
+        Places the legend at the given side of the axes. Defaults to 'top'.
+    c_max : int
+        Total number of columns allowed. Defaults to 4.
+    alpha : float
+        Alpha value for the background of the legend. Defaults to 0.8.
+    edgecolor : str | tuple[float, float, float]
+        Set the colour of the legend edge. Can also be set with the alias 'ec'.
+    facecolor : str | tuple[float, float, float]
+        Set the colour of the legend face. Can also be set with the alias 'fc'.
+    anchor_ : tuple[float, float] | None, optional
+        A custom location of the legend, where (0, 0) is the bottom left and (1, 1)
+        the top right of the box around the axes. See `topside_legends`.
+    **kwargs : Any
+        All keyword arguments are sent to fig.legend().
+
+    Returns
+    -------
+    mpl.legend.Legend
+        The legend of the figure.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import plastik
+    >>> fig, axs = plastik.figure_grid(2, 2)
+    >>> for ax in axs:
+    ...     _ = ax.plot([0, 1], c="C0", label="a")
+    ...     _ = ax.plot([1, 0], c="C1", label="b")
+    >>> [text.get_text() for text in figure_legend(fig, axs).get_texts()]
+    ['a', 'b']
+    >>> plt.close(fig)
+    """
+    axes_ = fig.axes if axes is None else list(np.ravel(np.asarray(axes, dtype=object)))
+    # The first handle of each label and style, in the order they are found
+    entries: dict[tuple[str, Hashable], Any] = {}
+    for ax in axes_:
+        for handle, label in zip(*ax.get_legend_handles_labels(), strict=True):
+            entries.setdefault((label, _style_key(handle)), handle)
+    labels = [label for label, _ in entries]
+    box = mpl.transforms.Bbox.union([ax.get_position() for ax in axes_])
+    return _place_legend(
+        fig,
+        list(entries.values()),
+        labels,
+        _n_columns(len(labels), c_max),
+        alpha=alpha,
+        side=side,
+        edgecolor=edgecolor,
+        facecolor=facecolor,
+        anchor_=anchor_,
+        transform=mpl.transforms.BboxTransformTo(box) + fig.transFigure,
+        **kwargs,
+    )
+
+
+__all__ = ["figure_legend", "topside_legends", "topside_legends_many"]
@@ -0,0 +1,203 @@
+"""Render many independent figure grids in parallel worker processes."""
+
+import concurrent.futures
+import multiprocessing.context
+import os
+import time
+import traceback
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from plastik.grid import FigurePool
+from plastik.profiling import phase
+
+# Figures are reused between the jobs that run in the same worker process
+_WORKER_POOL: FigurePool | None = None
+
+
+class RenderJob(NamedTuple):
+    """A figure to be drawn and saved by `render_parallel`.
+
+    Parameters
+    ----------
+    draw : Callable[[Figure, list[Axes]], Any]
+        Draws on the figure and axes from `figure_grid`. Must be picklable, that is, a
+        function defined at the top level of a module, or a `functools.partial` of one.
+    path : str | os.PathLike
+        The file to save the figure to.
+    rows : int
+        The number of rows in the figure. Default is 1.
+    columns : int
+        The number of columns in the figure. Default is 1.
+    using : dict[str, Any] | None
+        The properties of the sub-figures, see `FigureGrid.using`.
+    savefig_kwargs : dict[str, Any] | None
+        Keyword arguments to be passed to `Figure.savefig`.
+    """
+
+    draw: Callable[[Figure, list[Axes]], Any]
+    path: str | os.PathLike
+    rows: int = 1
+    columns: int = 1
+    using: dict[str, Any] | None = None
+    savefig_kwargs: dict[str, Any] | None = None
+
+
+class RenderResult(NamedTuple):
+    """The outcome of one `RenderJob`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The file the figure was saved to.
+    error : str | None
+        The formatted traceback if the job failed, otherwise None.
+    setup_time : float
+        Seconds spent getting the figure and its axes.
+    draw_time : float
+        Seconds spent in the job's draw function.
+    save_time : float
+        Seconds spent saving the figure.
+    pid : int
+        The process that ran the job, or 0 if it never reached a worker process.
+    """
+
+    path: str | os.PathLike
+    error: str | None
+    setup_time: float
+    draw_time: float
+    save_time: float
+    pid: int
+
+    @property
+    def ok(self) -> bool:
+        """Whether the figure was saved without errors."""
+        return self.error is None
+
+    @property
+    def wall_time(self) -> float:
+        """Total seconds spent on the job."""
+        return self.setup_time + self.draw_time + self.save_time
+
+
+def _render(job: RenderJob) -> RenderResult:
+    """Run one job on a figure from the pool of this process."""
+    global _WORKER_POOL  # noqa: PLW0603
+    if _WORKER_POOL is None:
+        _WORKER_POOL = FigurePool(maxsize=4)
+    pool = _WORKER_POOL
+    # Seconds spent on getting, drawing and saving the figure
+    times: list[float] = []
+    error = None
+    fig = None
+    start = time.perf_counter()
+    try:
+        fig, axs = pool(job.rows, job.columns, job.using)
+        times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        job.draw(fig, axs)
+        times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        fig.savefig(job.path, **(job.savefig_kwargs or {}))
+        times.append(time.perf_counter() - start)
+    except Exception:
+        error = traceback.format_exc()
+        times.append(time.perf_counter() - start)
+    finally:
+        if fig is not None:
+            try:
+                pool.release(fig)
+            except Exception:
+                # A figure that cannot be reset is dropped from the pool
+                pass
+    setup_time, draw_time, save_time = times + [0.0] * (3 - len(times))
+    return RenderResult(job.path, error, setup_time, draw_time, save_time, os.getpid())
+
+
+def _render_chunk(jobs: list[RenderJob]) -> list[RenderResult]:
+    return [_render(job) for job in jobs]
+
+
+def _failed(job: RenderJob, error: BaseException) -> RenderResult:
+    """Return the result of a job that failed outside of `_render`."""
+    text = "".join(traceback.format_exception(error))
+    return RenderResult(job.path, text, 0.0, 0.0, 0.0, 0)
+
+
+@phase("render_parallel")
+def render_parallel(
+    jobs: Iterable[RenderJob | tuple],
+    workers: int | None = None,
+    *,
+    chunksize: int = 1,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> list[RenderResult]:
+    """Draw and save independent figure grids in a pool of processes.
+
+    Each job gets a figure from `figure_grid` that is not tracked by pyplot, and is
+    saved to its path. Since each worker process reuses its figures between jobs (see
+    `FigurePool`), the draw functions should only use the figure and axes they are
+    given, and not the pyplot state.
+
+    Parameters
+    ----------
+    jobs : Iterable[RenderJob | tuple]
+        The figures to render. Tuples are converted to `RenderJob`.
+    workers : int | None
+        The number of worker processes. Defaults to the number of CPUs. With one
+        worker, the jobs are run in the calling process.
+    chunksize : int
+        The number of jobs sent to a worker at a time. Larger chunks reduce the
+        overhead when there are many small jobs. If a chunk cannot be sent to a worker,
+        for example because a job cannot be pickled, or the worker crashes, all its
+        jobs fail. Default is 1.
+    mp_context : multiprocessing.context.BaseContext | None
+        The context used to start the worker processes, see
+        `concurrent.futures.ProcessPoolExecutor`.
+
+    Returns
+    -------
+    list[RenderResult]
+        One result per job, in the order of 'jobs'. Failed jobs do not stop the others;
+        check `RenderResult.ok`.
+
+    Raises
+    ------
+    ValueError
+        If 'workers' or 'chunksize' is not positive.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> def draw(fig, axs):
+    ...     axs[0].plot([1, 2, 3])
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     jobs = [(draw, Path(tmp) / f"{i}.png", 1, 2) for i in range(3)]
+    ...     results = render_parallel(jobs, workers=1)
+    >>> all(result.ok for result in results)
+    True
+    """
+    jobs_ = [job if isinstance(job, RenderJob) else RenderJob(*job) for job in jobs]
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError(f"'workers' must be positive, got {workers}.")
+    if chunksize < 1:
+        raise ValueError(f"'chunksize' must be positive, got {chunksize}.")
+    if workers == 1 or len(jobs_) <= 1:
+        return [_render(job) for job in jobs_]
+    chunks = [jobs_[i : i + chunksize] for i in range(0, len(jobs_), chunksize)]
+    results: list[RenderResult] = []
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)), mp_context=mp_context
+    ) as executor:
+        futures = [executor.submit(_render_chunk, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures, strict=True):
+            try:
+                results.extend(future.result())
+            except Exception as error:
+                results.extend(_failed(job, error) for job in chunk)
+    return results
@@ -1,15 +1,379 @@
 """Module for plotting percentiles from an ensemble of arrays."""
 
-from typing import Any
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
 
+from plastik import decimate as _decimate
+from plastik.profiling import phase
 
+
+class PercentileBands(NamedTuple):
+    """Percentile band edges, median and mean of an ensemble.
+
+    Attributes
+    ----------
+    lower : np.ndarray
+        The lower edge of each band, shape (n, len(x)).
+    upper : np.ndarray
+        The upper edge of each band, shape (n, len(x)).
+    median : np.ndarray
+        The median of the ensemble, shape (len(x),).
+    mean : np.ndarray
+        The mean of the ensemble, shape (len(x),).
+    error : float
+        Upper bound on the absolute error of the band edges and the median. Zero when
+        they are computed exactly.
+    """
+
+    lower: np.ndarray
+    upper: np.ndarray
+    median: np.ndarray
+    mean: np.ndarray
+    error: float = 0.0
+
+
+def _band_levels(
+    n: int, percentile_min: float, percentile_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the lower and upper percentile levels of the `n` bands."""
+    lower = np.linspace(percentile_min, 50, num=n, endpoint=False)
+    upper = np.linspace(50, percentile_max, num=n + 1)[1:]
+    return lower, upper
+
+
+def _order_statistics(
+    members: int, n: int, percentile_min: float, percentile_max: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the order statistics and weights of all band edges and the median.
+
+    The values follow the 'linear' method of ``np.percentile``: each of the 2n + 1
+    percentiles lies between the sorted members at index 'previous' and 'following',
+    with 'gamma' being the weight of the latter.
+    """
+    lower, upper = _band_levels(n, percentile_min, percentile_max)
+    quantiles = np.true_divide(np.concatenate((lower, upper, [50])), 100)
+    virtual = (members - 1) * quantiles
+    previous = np.floor(virtual).astype(np.intp)
+    following = np.minimum(previous + 1, members - 1)
+    gamma = (virtual - previous)[:, np.newaxis]
+    return previous, following, gamma
+
+
+def _output_buffer(
+    out: np.ndarray | None, n: int, columns: int, dtype: np.dtype
+) -> np.ndarray:
+    if out is None:
+        return np.empty((2 * n + 2, columns), dtype=dtype)
+    if out.shape != (2 * n + 2, columns):
+        raise ValueError(
+            f"'out' must have shape {(2 * n + 2, columns)}, got {out.shape}."
+        )
+    return out
+
+
+def percentile_bands(  # noqa: PLR0913
+    y: np.ndarray,
+    n: int = 20,
+    *,
+    percentile_min: float = 1,
+    percentile_max: float = 99,
+    out: np.ndarray | None = None,
+    workers: int | None = None,
+) -> PercentileBands:
+    """Calculate all percentile bands, the median and the mean of 'y' in one pass.
+
+    The ensemble is sorted once along its first axis, and all band edges and the
+    median are read from the same sorted copy. The interpolation is the same as
+    the default ('linear') method of ``np.percentile``, and as there, the band edges,
+    median and mean of a column that contains NaN are all NaN.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Values along y-axis. Need shape (N, len(x)).
+    n : int
+        The number of percentiles, linearly spaced from 50 to 'percentile_m{in,ax}'.
+        Defaults to 20.
+    percentile_min : float
+        Lower percentile limit. Defaults to 1.
+    percentile_max : float
+        Upper percentile limit. Defaults to 99.
+    out : np.ndarray | None, optional
+        Buffer of shape (2 * n + 2, len(x)) and float dtype to write the result to. The
+        rows hold the `n` lower edges, the `n` upper edges, the median and the mean, in
+        that order. Re-using the same buffer avoids allocating new output arrays on
+        repeated calls.
+    workers : int | None, optional
+        Split the x-axis into this many blocks of columns and compute them on a thread
+        pool. NumPy releases the GIL while sorting, so this scales with the number of
+        cores. The result is identical to the serial computation. Defaults to serial.
+
+    Returns
+    -------
+    PercentileBands
+        Views into the output buffer with the lower and upper band edges, the median
+        and the mean.
+
+    Raises
+    ------
+    ValueError
+        If 'y' is not two dimensional, or if 'out' has the wrong shape.
+
+    Examples
+    --------
+    >>> y = np.random.default_rng(0).normal(size=(100, 10))
+    >>> bands = percentile_bands(y, n=5)
+    >>> bands.lower.shape
+    (5, 10)
+    >>> bool(np.allclose(bands.median, np.median(y, axis=0)))
+    True
+    """
+    y = np.asarray(y)
+    if y.ndim != 2:  # noqa: PLR2004
+        raise ValueError(f"'y' must have shape (N, len(x)), got {y.shape}.")
+    members, columns = y.shape
+    out = _output_buffer(out, n, columns, np.result_type(y.dtype, 1.0))
+    # Integers are sorted as floats, which keeps their order and lets np.take write
+    # straight into 'out'
+    y = y.astype(out.dtype, copy=False)
+    previous, following, gamma = _order_statistics(
+        members, n, percentile_min, percentile_max
+    )
+    if workers is not None and workers > 1 and columns > 1:
+        blocks = np.array_split(np.arange(columns), min(workers, columns))
+        with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+            list(
+                pool.map(
+                    lambda b: _sorted_bands(
+                        y[:, b[0] : b[-1] + 1],
+                        out[:, b[0] : b[-1] + 1],
+                        previous,
+                        following,
+                        gamma,
+                    ),
+                    blocks,
+                )
+            )
+    else:
+        _sorted_bands(y, out, previous, following, gamma)
+    # The summation order of the mean depends on the memory layout, so it is always
+    # taken over the whole array for the result to not depend on 'workers'.
+    np.mean(y, axis=0, out=out[-1])
+    return PercentileBands(out[:n], out[n : 2 * n], out[2 * n], out[-1])
+
+
+def _sorted_bands(
+    y: np.ndarray,
+    out: np.ndarray,
+    previous: np.ndarray,
+    following: np.ndarray,
+    gamma: np.ndarray,
+) -> None:
+    """Write the band edges and the median of 'y' to 'out'."""
+    # A single sort is cheaper than a partition around the 4n + 2 indices we need
+    part = np.sort(y, axis=0)
+    # Same interpolation as the 'linear' method of np.percentile
+    edges = out[:-1]
+    np.take(part, previous, axis=0, out=edges)
+    upper_edges = part[following]
+    # NaN sorts last, and np.percentile gives NaN for any column that contains it
+    missing = np.isnan(part[-1])
+    del part
+    diff = np.subtract(upper_edges, edges)
+    from_upper = np.broadcast_to(gamma >= 0.5, edges.shape)  # noqa: PLR2004
+    np.add(edges, diff * gamma, out=edges, where=~from_upper)
+    np.subtract(upper_edges, diff * (1 - gamma), out=edges, where=from_upper)
+    if missing.any():
+        edges[:, missing] = np.nan
+
+
+def _iter_chunks(
+    chunks: np.ndarray | Iterable[np.ndarray], chunk_size: int | None
+) -> Iterable[np.ndarray]:
+    """Yield two dimensional blocks of ensemble members."""
+    if isinstance(chunks, np.ndarray):
+        rows = chunk_size or max(1, 2**22 // max(1, chunks.shape[-1]))
+        for start in range(0, len(chunks), rows):
+            yield np.asarray(chunks[start : start + rows], dtype=np.float64)
+        return
+    for chunk in chunks:
+        yield np.atleast_2d(np.asarray(chunk, dtype=np.float64))
+
+
+def percentile_bands_streaming(  # noqa: PLR0913
+    chunks: np.ndarray | Iterable[np.ndarray],
+    n: int = 20,
+    *,
+    bins: int = 256,
+    value_range: tuple[float, float] | None = None,
+    chunk_size: int | None = None,
+    percentile_min: float = 1,
+    percentile_max: float = 99,
+    out: np.ndarray | None = None,
+) -> PercentileBands:
+    """Estimate percentile bands of an ensemble that does not fit in memory.
+
+    The ensemble members are streamed through a fixed-bin histogram per x column. The
+    histograms of separate chunks are simply added, so the members can arrive in any
+    order and in chunks of any size. Each band edge and the median are then read from
+    the histograms by assuming the members inside a bin are evenly spread, which puts
+    the estimate within one bin width of the value ``percentile_bands`` computes. The
+    mean is exact.
+
+    Parameters
+    ----------
+    chunks : np.ndarray | Iterable[np.ndarray]
+        The ensemble, either as an array of shape (N, len(x)) such as an
+        ``np.memmap``, which is read ``chunk_size`` members at a time, or as an
+        iterable of arrays of shape (k, len(x)) or (len(x),).
+    n : int
+        The number of percentiles, linearly spaced from 50 to 'percentile_m{in,ax}'.
+        Defaults to 20.
+    bins : int
+        The number of histogram bins per x column. The memory used by the histograms
+        is ``8 * bins * len(x)`` bytes. Defaults to 256.
+    value_range : tuple[float, float] | None, optional
+        The lower and upper edge of the histograms. Values outside are counted in the
+        first and last bin, and the error bound does not hold for band edges that fall
+        there. If not given, the range is found in an extra pass over 'chunks', which
+        then cannot be a one-shot iterator.
+    chunk_size : int | None, optional
+        The number of members read at a time when 'chunks' is an array. Defaults to a
+        block of about four million values.
+    percentile_min : float
+        Lower percentile limit. Defaults to 1.
+    percentile_max : float
+        Upper percentile limit. Defaults to 99.
+    out : np.ndarray | None, optional
+        Buffer of shape (2 * n + 2, len(x)) to write the result to, see
+        ``percentile_bands``.
+
+    Returns
+    -------
+    PercentileBands
+        The estimated band edges and median, the exact mean, and the bin width as the
+        error bound.
+
+    Raises
+    ------
+    ValueError
+        If 'value_range' is not given and 'chunks' is a one-shot iterator, or if
+        'chunks' is empty.
+
+    Examples
+    --------
+    >>> y = np.random.default_rng(0).normal(size=(1000, 10))
+    >>> chunks = (y[i : i + 100] for i in range(0, 1000, 100))
+    >>> bands = percentile_bands_streaming(chunks, n=5, value_range=(-5, 5))
+    >>> exact = percentile_bands(y, n=5)
+    >>> bool(np.all(np.abs(bands.lower - exact.lower) <= bands.error))
+    True
+    """
+    if value_range is None:
+        if not isinstance(chunks, np.ndarray) and iter(chunks) is chunks:
+            raise ValueError(
+                "'value_range' must be given when 'chunks' can only be iterated once."
+            )
+        extremes = np.array(
+            [(c.min(), c.max()) for c in _iter_chunks(chunks, chunk_size)]
+        )
+        if not extremes.size:
+            raise ValueError("'chunks' must contain at least one ensemble member.")
+        value_range = (extremes[:, 0].min(), extremes[:, 1].max())
+    low, high = value_range
+    width = (high - low) / bins
+    scale = 1 / width if width > 0 else 0.0
+    counts = None
+    total = None
+    members = 0
+    for chunk in _iter_chunks(chunks, chunk_size):
+        if counts is None or total is None:
+            columns = chunk.shape[1]
+            counts = np.zeros((columns, bins), dtype=np.int64)
+            total = np.zeros(columns)
+            column_offsets = np.arange(columns) * bins
+        idx = ((chunk - low) * scale).astype(np.intp)
+        np.clip(idx, 0, bins - 1, out=idx)
+        idx += column_offsets
+        counts += np.bincount(idx.ravel(), minlength=bins * columns).reshape(
+            columns, bins
+        )
+        total += chunk.sum(axis=0)
+        members += len(chunk)
+    if counts is None or total is None:
+        raise ValueError("'chunks' must contain at least one ensemble member.")
+    out = _output_buffer(out, n, columns, np.dtype(np.float64))
+    previous, following, gamma = _order_statistics(
+        members, n, percentile_min, percentile_max
+    )
+    # Search all columns at once by shifting each cumulative histogram above the
+    # previous one, which keeps the flattened array sorted.
+    cumulative = np.cumsum(counts, axis=1)
+    shift = np.arange(columns) * (members + 1)
+    flat = (cumulative + shift[:, np.newaxis]).ravel()
+
+    def order_statistic(rank: np.ndarray) -> np.ndarray:
+        keys = rank[:, np.newaxis] + shift
+        b = np.searchsorted(flat, keys, side="right") - column_offsets
+        b_flat = b + column_offsets
+        before = np.where(b > 0, flat[b_flat - 1] - shift, 0)
+        in_bin = counts.ravel()[b_flat]
+        return low + width * (b + (keys - shift - before + 0.5) / in_bin)
+
+    first = order_statistic(previous)
+    edges = out[: 2 * n + 1]
+    np.subtract(order_statistic(following), first, out=edges)
+    edges *= gamma
+    edges += first
+    np.divide(total, members, out=out[-1])
+    return PercentileBands(
+        out[:n], out[n : 2 * n], out[2 * n], out[-1], error=float(width)
+    )
+
+
+def _fill_bands(  # noqa: PLR0913
+    ax: mpl.axes.Axes,
+    x: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    *,
+    alpha: float | np.ndarray,
+    color: Any,
+) -> PolyCollection:
+    """Fill all bands as polygons in a single ``PolyCollection``.
+
+    Each polygon walks along the lower edge and back along the upper edge, which is
+    the same outline ``ax.fill_between`` draws for one band.
+    """
+    x = np.asarray(x)
+    n, m = lower.shape
+    verts = np.empty((n, 2 * m, 2))
+    verts[:, :m, 0] = x
+    verts[:, m:, 0] = x[::-1]
+    verts[:, :m, 1] = lower
+    verts[:, m:, 1] = upper[:, ::-1]
+    facecolors = np.tile(mpl.colors.to_rgba(color), (n, 1))
+    facecolors[:, 3] = alpha
+    collection = PolyCollection(
+        verts,  # type: ignore[arg-type]
+        facecolors=facecolors,
+        edgecolors="none",
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+@phase("percentiles")
 def percentiles(  # noqa: PLR0913
     x: np.ndarray,
-    y: np.ndarray,
+    y: np.ndarray | PercentileBands,
     n: int = 20,
     ax: mpl.axes.Axes | None = None,
     plot_mean: bool = False,
@@ -22,11 +386,12 @@ def percentiles(  # noqa: PLR0913
     ----------
     x : np.ndarray
         One dimensional array, x-axis.
-    y : np.ndarray
-        Values along y-axis. Need shape (N, len(x)).
+    y : np.ndarray | PercentileBands
+        Values along y-axis. Need shape (N, len(x)). Percentile bands that are already
+        computed, for example with ``percentile_bands_streaming``, are drawn as is.
     n : int
         The number of percentiles, linearly spaced from 50 to 'percentile_m{in,ax}'.
-        Defaults to 20.
+        Defaults to 20. Ignored when 'y' is a ``PercentileBands``.
     ax : mpl.axes.Axes | None, optional
         The axes object to plot on. If not given, the current axes will be used.
     plot_mean : bool
@@ -34,8 +399,9 @@ def percentiles(  # noqa: PLR0913
     plot_median : bool
         Plot median of 'y'
     **kwargs : Any
-        alpha : str
-            Alpha value of each layer of the percentiles
+        alpha : float | np.ndarray
+            Alpha value of each layer of the percentiles. With the 'collection'
+            renderer, a sequence of one alpha value per band is also accepted.
         color : str
             Colour of the percentile shading. Can be any colour that can be parsed by
             matplotlib's plotting function.
@@ -46,32 +412,82 @@ def percentiles(  # noqa: PLR0913
             Lower percentile limit.
         percentile_max : float
             Upper percentile limit.
+        out : np.ndarray
+            Buffer that is re-used for the percentile calculation, see
+            ``percentile_bands``.
+        workers : int
+            Number of threads used for the percentile calculation, see
+            ``percentile_bands``.
+        renderer : str
+            How the bands are drawn. 'fill_between' (default) calls
+            ``ax.fill_between`` once per band, while 'collection' draws all bands as
+            a single ``PolyCollection``, which is much faster to draw and save when
+            'n' is large.
+        decimate : bool | int
+            Reduce the data to what can be resolved on screen before drawing. With
+            True, one bucket per pixel column of 'ax' at the figure DPI is used, an
+            integer sets the number of buckets. Lines keep the first, last, minimum and
+            maximum sample of each bucket, bands keep the outermost edges. Defaults to
+            False.
 
     Returns
     -------
     mpl.axes.Axes
         The axes object of the figure.
+
+    Raises
+    ------
+    ValueError
+        If the 'renderer' keyword argument is not recognised.
     """
     ax = ax or plt.gca()
     # calculate the lower and upper percentile groups, skipping 50 percentile
     percentile_min = kwargs.pop("percentile_min") if "percentile_min" in kwargs else 1
     percentile_max = kwargs.pop("percentile_max") if "percentile_max" in kwargs else 99
-    perc1 = np.percentile(
-        y, np.linspace(percentile_min, 50, num=n, endpoint=False), axis=0
-    )
-    perc2 = np.percentile(y, np.linspace(50, percentile_max, num=n + 1)[1:], axis=0)
+    out = kwargs.pop("out", None)
+    if isinstance(y, PercentileBands):
+        bands = y
+        n = len(bands.lower)
+    else:
+        with phase("compute"):
+            bands = percentile_bands(
+                y,
+                n,
+                percentile_min=percentile_min,
+                percentile_max=percentile_max,
+                out=out,
+                workers=kwargs.pop("workers", None),
+            )
 
-    color = kwargs.pop("color") if "color" in kwargs else "r"
-    line_color = kwargs.pop("line_color") if "line_color" in kwargs else "k"
-    if plot_mean:
-        ax.plot(x, np.mean(y, axis=0), color=line_color)
+    with phase("draw"):
+        color = kwargs.pop("color") if "color" in kwargs else "r"
+        line_color = kwargs.pop("line_color") if "line_color" in kwargs else "k"
+        decimate = kwargs.pop("decimate") if "decimate" in kwargs else False
+        buckets = _decimate.n_buckets(ax, decimate)
+        log = ax.get_xscale() == "log"
+        if plot_mean:
+            ax.plot(*_decimate.m4(x, bands.mean, buckets, log=log), color=line_color)
 
-    if plot_median:
-        ax.plot(x, np.median(y, axis=0), "-d", color=line_color)
+        if plot_median:
+            ax.plot(
+                *_decimate.m4(x, bands.median, buckets, log=log), "-d", color=line_color
+            )
 
-    alpha = kwargs.pop("alpha") if "alpha" in kwargs else 1 / n
-    # fill lower and upper percentile groups
-    for p1, p2 in zip(perc1, perc2, strict=True):
-        ax.fill_between(x, p1, p2, alpha=alpha, color=color, edgecolor=None)
+        alpha = kwargs.pop("alpha") if "alpha" in kwargs else 1 / n
+        renderer = kwargs.pop("renderer") if "renderer" in kwargs else "fill_between"
+        x_fill, lower, upper = _decimate.envelope(
+            x, bands.lower, bands.upper, buckets, log=log
+        )
+        # fill lower and upper percentile groups
+        match renderer:
+            case "fill_between":
+                for p1, p2 in zip(lower, upper, strict=True):
+                    ax.fill_between(
+                        x_fill, p1, p2, alpha=alpha, color=color, edgecolor=None
+                    )
+            case "collection":
+                _fill_bands(ax, x_fill, lower, upper, alpha=alpha, color=color)
+            case _:
+                raise ValueError(f"Unknown renderer: {renderer}")
 
     return ax
@@ -0,0 +1,249 @@
+"""Opt-in timing and memory instrumentation of the plotting helpers.
+
+The plotting functions in ``plastik`` mark their phases with ``phase``. Nothing is
+recorded unless a profile is active, either inside the ``profile`` context manager, or
+for the whole process when the environment variable ``PLASTIK_PROFILE`` is set to the
+path of a JSON file that the results are written to at exit. Set
+``PLASTIK_PROFILE_MEMORY=1`` to also record allocations in that case.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _Measurement:
+    """The traced memory at the start of a measurement and the highest peak since."""
+
+    __slots__ = ("peak", "start")
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.peak = start
+
+
+# The memory measurements in progress, in all profiles and threads. Starting one resets
+# the peak of tracemalloc for the whole process, so the peak so far is first saved in
+# each of the others.
+_measurements: set[_Measurement] = set()
+_measurements_lock = threading.Lock()
+
+
+def _start_measurement() -> _Measurement:
+    with _measurements_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        for measurement in _measurements:
+            measurement.peak = max(measurement.peak, peak)
+        tracemalloc.reset_peak()
+        measurement = _Measurement(current)
+        _measurements.add(measurement)
+    return measurement
+
+
+def _stop_measurement(measurement: _Measurement) -> tuple[int, int] | None:
+    """Return the net allocation and the peak above the start of a measurement."""
+    with _measurements_lock:
+        _measurements.discard(measurement)
+        if not tracemalloc.is_tracing():
+            return None
+        now, peak = tracemalloc.get_traced_memory()
+    peak = max(peak, measurement.peak)
+    return now - measurement.start, peak - measurement.start
+
+
+class Profile:
+    """Wall time and memory allocations of each phase entered while active.
+
+    Parameters
+    ----------
+    memory : bool
+        Record the net allocation and peak memory of each phase with ``tracemalloc``.
+        Note that ``tracemalloc`` counts the allocations of all threads.
+
+    Attributes
+    ----------
+    peak : int | None
+        The peak memory in bytes above the memory at the start of the ``profile``
+        context, set when it exits. None if memory is not recorded.
+    """
+
+    def __init__(self, *, memory: bool = True) -> None:
+        self.memory = memory
+        self.records: list[dict[str, Any]] = []
+        self.peak: int | None = None
+        self._local = threading.local()
+
+    def _stack(self) -> list[list[Any]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _enter(self, name: str) -> None:
+        stack = self._stack()
+        path = f"{stack[-1][0]}/{name}" if stack else name
+        measurement = None
+        if self.memory and tracemalloc.is_tracing():
+            measurement = _start_measurement()
+        stack.append([path, time.perf_counter(), measurement])
+
+    def _exit(self) -> None:
+        end = time.perf_counter()
+        path, start, measurement = self._stack().pop()
+        record: dict[str, Any] = {"phase": path, "wall_time": end - start}
+        memory = _stop_measurement(measurement) if measurement is not None else None
+        if memory is not None:
+            record["allocated"], record["peak"] = memory
+        self.records.append(record)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return all recorded phases and the totals per phase.
+
+        Returns
+        -------
+        dict[str, Any]
+            The key 'phases' holds one record per entered phase, in the order they
+            finished, with the wall time in seconds and, if memory is recorded, the net
+            allocated and peak memory in bytes. The key 'totals' maps each phase to its
+            number of calls, total wall time and largest peak.
+        """
+        totals: dict[str, dict[str, Any]] = {}
+        for record in self.records:
+            total = totals.setdefault(
+                record["phase"], {"calls": 0, "wall_time": 0.0, "peak": 0}
+            )
+            total["calls"] += 1
+            total["wall_time"] += record["wall_time"]
+            total["peak"] = max(total["peak"], record.get("peak", 0))
+        return {"phases": list(self.records), "totals": totals}
+
+    def to_json(self, path: str | os.PathLike | None = None, **kwargs: Any) -> str:
+        """Return the recorded phases as JSON, optionally also writing them to a file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | None, optional
+            Write the JSON to this file.
+        **kwargs : Any
+            Keyword arguments given to ``json.dumps``.
+
+        Returns
+        -------
+        str
+            The output of ``to_dict`` as JSON.
+        """
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+
+def _profile_from_environment() -> Profile | None:
+    path = os.environ.get("PLASTIK_PROFILE")
+    if not path:
+        return None
+    memory = os.environ.get("PLASTIK_PROFILE_MEMORY", "") not in {"", "0"}
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    prof = Profile(memory=memory)
+    atexit.register(prof.to_json, path, indent=2)
+    return prof
+
+
+_ENVIRONMENT_PROFILE = _profile_from_environment()
+_active: contextvars.ContextVar[Profile | None] = contextvars.ContextVar(
+    "plastik_profile", default=None
+)
+
+
+@contextlib.contextmanager
+def profile(*, memory: bool = True) -> Iterator[Profile]:
+    """Record the phases of all ``plastik`` plotting calls made inside the context.
+
+    Parameters
+    ----------
+    memory : bool
+        Also record allocations with ``tracemalloc``, which is started for the
+        duration of the context if it is not already running. This slows down the
+        profiled code. Defaults to True.
+
+    Yields
+    ------
+    Profile
+        The profile that collects the phases, see ``Profile.to_dict``.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import plastik
+    >>> with plastik.profile() as prof:
+    ...     fig, axs = plastik.figure_grid(1, 2)
+    >>> [record["phase"] for record in prof.to_dict()["phases"]]
+    ['FigureGrid.get_grid']
+    >>> plt.close(fig)
+    """
+    prof = Profile(memory=memory)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    measurement = _start_measurement() if tracemalloc.is_tracing() else None
+    token = _active.set(prof)
+    try:
+        yield prof
+    finally:
+        _active.reset(token)
+        measured = _stop_measurement(measurement) if measurement is not None else None
+        if measured is not None:
+            prof.peak = measured[1]
+        if started:
+            tracemalloc.stop()
+
+
+class phase:  # noqa: N801
+    """Mark the enclosed block as a named phase of the active profile, if any.
+
+    Can be used as a context manager, or as a decorator to mark a whole function.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase. Nested phases are recorded as 'outer/inner'.
+    """
+
+    __slots__ = ("_name", "_profile")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._profile: Profile | None = None
+
+    def __enter__(self) -> None:
+        """Start the phase."""
+        self._profile = _active.get() or _ENVIRONMENT_PROFILE
+        if self._profile is not None:
+            self._profile._enter(self._name)
+
+    def __exit__(self, *_: object) -> None:
+        """End the phase."""
+        if self._profile is not None:
+            self._profile._exit()
+
+    def __call__(self, func: _F) -> _F:
+        """Mark each call to 'func' as a phase."""
+        name = self._name
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
@@ -1,15 +1,72 @@
 """Creates a ridge plot figure."""
 
 import itertools
-from typing import Any
+import os
+import warnings
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, NamedTuple
 
 import attr
 import matplotlib as mpl
 import matplotlib.gridspec as grid_spec
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 import plastik
+from plastik import decimate as _decimate
+from plastik.profiling import phase
+
+
+class _Extents(NamedTuple):
+    """The first, smallest, largest and first positive x-value and the y-range."""
+
+    x_first: np.ndarray
+    x_min: np.ndarray
+    x_max: np.ndarray
+    x_positive: np.ndarray
+    y_min: np.ndarray
+    y_max: np.ndarray
+
+
+def _series_extents(
+    s: tuple[np.ndarray, np.ndarray] | np.ndarray, positive: bool
+) -> tuple[float, float, float, float, float, float]:
+    """Return the extents of one ridge in the order of the ``_Extents`` fields."""
+    if isinstance(s, np.ndarray):
+        return (0, 0, len(s) - 1, 1, s.min(), s.max())
+    x, y = np.asarray(s[0]), np.asarray(s[1])
+    x_positive = np.nan
+    if positive:
+        first = np.argmax(x > 0)
+        x_positive = x[first] if x[first] > 0 else np.nan
+    return (x[0], x.min(), x.max(), x_positive, y.min(), y.max())
+
+
+def _tick_label(value: float, log: bool) -> str:
+    """Format a y-tick of the single axes engine like the default formatters."""
+    if log:
+        return rf"$\mathdefault{{10^{{{np.log10(value):.0f}}}}}$"
+    return f"{value:g}".replace("-", "\N{MINUS SIGN}")
+
+
+class _DeprecatedColors:
+    """The former ``Ridge.colors`` attribute, a cycle over the colour of each ridge.
+
+    On the class, it cycles over the colours of ``axes.prop_cycle``, as it used to.
+    """
+
+    def __get__(self, ridge: "Ridge | None", owner: type) -> Iterator[str]:
+        warnings.warn(
+            "'Ridge.colors' is deprecated, use 'Ridge.ridge_colors' instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if ridge is None:
+            return itertools.cycle(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+        return itertools.cycle(ridge.ridge_colors)
 
 
 @attr.s(auto_attribs=True)
@@ -44,6 +101,33 @@ class Ridge:
     kwargs : Dict
         Any keyword argument plt.plot accepts. (Need to be a dict, asterisk syntax not
         supported.)
+    decimate : bool | int
+        Reduce each line to what can be resolved on screen before drawing. With True,
+        one bucket per pixel column of the ridge axes at the figure DPI is used, an
+        integer sets the number of buckets. The first, last, minimum and maximum sample
+        of each bucket are kept. Defaults to False.
+    workers : int | None
+        Number of threads used to scan the data for the axis limits. Defaults to
+        scanning serially.
+    palette : str | list[str] | None
+        The name of a colour map, or a list of colours to interpolate between, from
+        which one colour per ridge is drawn with ``plastik.colors.create_colorlist``.
+        Defaults to the colours of ``axes.prop_cycle``, repeated as needed.
+    fig : mpl.figure.Figure | None
+        Draw the ridges in this figure, which is used at its current size. Defaults to
+        creating a new figure.
+    pyplot : bool
+        Create the figure with ``plt.figure``. If False, a bare ``Figure`` that pyplot
+        does not track is created instead, so that ridge plots can be built from
+        several threads at once and are freed when no longer referenced. Defaults to
+        True.
+    engine : Literal["axes", "collection"]
+        With 'axes', each ridge is drawn in its own axes. With 'collection', all
+        ridges are drawn as vertically offset lines of a single ``LineCollection`` in
+        one axes, with the y-ticks of each ridge placed at its offset. This is much
+        faster for hundreds of ridges. The 'kwargs' are then given to the
+        ``LineCollection``, and 'lines' holds one legend handle per ridge. Defaults to
+        'axes'.
     """
 
     data: list[Any] = attr.ib()
@@ -64,20 +148,41 @@ class Ridge:
     ylim: list[float] = attr.Factory(list)
     pltype: str = attr.ib(converter=str, default="plot")
     kwargs: dict[str, Any] = attr.Factory(dict)
-    colors = itertools.cycle(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+    decimate: bool | int = attr.ib(kw_only=True, default=False)
+    workers: int | None = attr.ib(kw_only=True, default=None)
+    palette: str | list[str] | None = attr.ib(kw_only=True, default=None)
+    fig: Figure | None = attr.ib(kw_only=True, default=None, repr=False, eq=False)
+    pyplot: bool = attr.ib(kw_only=True, default=True)
+    engine: Literal["axes", "collection"] = attr.ib(
+        kw_only=True,
+        default="axes",
+        validator=attr.validators.in_(("axes", "collection")),
+    )
+    _extents_cache: tuple[list[Any], str, _Extents] | None = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
+    # Deprecated, use 'ridge_colors'
+    colors = _DeprecatedColors()
 
     def set_grid(self) -> None:
         """Set the gridstructure of the figure."""
         fsize = (4, self.y_scale * len(self.data))
-        self.gs = grid_spec.GridSpec(len(self.data), 1)
-        self.__fig = plt.figure(figsize=fsize)
+        if self.fig is not None:
+            self.__fig = self.fig
+        elif self.pyplot:
+            self.__fig = plt.figure(figsize=fsize)
+        else:
+            self.__fig = Figure(figsize=fsize)
         # Set line type of horizontal grid lines
         self.gls = itertools.cycle(["-", "--"])
         self.ax_objs: list[mpl.axes.Axes] = []
-        if "z" in self.options:
-            self.gs.update(hspace=-0.5)
-        else:
-            self.gs.update(hspace=0.0)
+        # Bound to the figure, so that it does not look up the pyplot figures
+        self.gs = grid_spec.GridSpec(
+            len(self.data),
+            1,
+            figure=self.__fig,
+            hspace=-0.5 if "z" in self.options else 0.0,
+        )
 
     def set_xaxs(self) -> None:
         """Set the x-axis limits."""
@@ -110,7 +215,8 @@ class Ridge:
                 left=False,
                 right=False,
             )
-            plt.setp(self.ax.get_yticklabels(), alpha=0)
+            for label in self.ax.get_yticklabels():
+                label.set_alpha(0)
         else:
             self._set_ymin_ymax(y_min, y_max)
 
@@ -131,7 +237,7 @@ class Ridge:
         spine = ["top", "bottom", "left", "right"]
         for sp in spine:
             self.ax_objs[-1].spines[sp].set_visible(False)
-        plt.tick_params(
+        self.ax_objs[-1].tick_params(
             axis="both",
             which="both",
             bottom=False,
@@ -172,25 +278,27 @@ class Ridge:
         if ("g" in self.options and "z" not in self.options) or (
             "g" in self.options and len(self.data) == 1
         ):
-            plt.grid(True, which="major", ls="-", alpha=0.2)
+            self.ax_objs[-1].grid(True, which="major", ls="-", alpha=0.2)
         elif "g" in self.options:
-            plt.minorticks_off()
+            self.ax_objs[-1].minorticks_off()
             alpha = 0.2 if i in (0, len(self.data) - 1) else 0.1
-            plt.grid(True, axis="y", which="major", ls=next(self.gls), alpha=0.2)
-            plt.grid(True, axis="x", which="major", ls="-", alpha=alpha)
+            self.ax_objs[-1].grid(
+                True, axis="y", which="major", ls=next(self.gls), alpha=0.2
+            )
+            self.ax_objs[-1].grid(True, axis="x", which="major", ls="-", alpha=alpha)
 
     def __resolve_first_last_axis(self, i) -> None:
         if i == len(self.data) - 1:
             if self.xlabel:
-                plt.xlabel(self.xlabel)
+                self.ax_objs[-1].set_xlabel(self.xlabel)
             if len(self.data) != 1:
-                plt.tick_params(axis="x", which="both", top=False)
+                self.ax_objs[-1].tick_params(axis="x", which="both", top=False)
         elif i == 0:
-            plt.tick_params(
+            self.ax_objs[-1].tick_params(
                 axis="x", which="both", bottom=False, labelbottom=False
             )  # , labeltop=True
         else:
-            plt.tick_params(
+            self.ax_objs[-1].tick_params(
                 axis="x", which="both", bottom=False, top=False, labelbottom=False
             )
 
@@ -224,18 +332,27 @@ class Ridge:
             spines = ["top"]
         else:
             spines = ["top", "bottom"]
-        s_ = s if isinstance(s, np.ndarray) else s[1]
-        y_min = min(s_.min(), y_min)
-        y_max = max(s_.max(), y_max)
+        extents = self.extents
+        y_min = min(extents.y_min[i], y_min)
+        y_max = max(extents.y_max[i], y_max)
         return y_min, y_max, s, spines
 
+    def __line_data(self, s) -> tuple[np.ndarray, np.ndarray]:
+        """Return the x and y values of one ridge, decimated if requested."""
+        x, y = s if len(s) == 2 else (np.arange(len(s)), s)  # noqa: PLR2004
+        if self.decimate:
+            x, y = _decimate.m4(
+                x,
+                y,
+                _decimate.n_buckets(self.ax_objs[-1], self.decimate),
+                log=self.pltype in ["loglog", "semilogx"],
+            )
+        return x, y
+
     def __draw_lines(self, s, col) -> None:
         # Plot data
         p_func = getattr(self.ax_objs[-1], self.pltype)
-        if len(s) == 2:  # noqa: PLR2004
-            ell = p_func(s[0], s[1], color=col, markersize=2.5, **self.kwargs)[0]
-        else:
-            ell = p_func(s, color=col, markersize=2.5, **self.kwargs)[0]
+        ell = p_func(*self.__line_data(s), color=col, markersize=2.5, **self.kwargs)[0]
 
         # Append in line-list to create legend
         self.__lines.append(ell)
@@ -246,15 +363,16 @@ class Ridge:
         self.__lines: list[mpl.lines.Line2D] = []
         y_min = np.inf
         y_max = -np.inf
+        colors = self.ridge_colors
         for i, s in enumerate(self.data):
-            col = next(self.colors)
+            col = colors[i]
             y_min, y_max, s_, spines = self.__setup_axis(y_min, y_max, i, s)
             self.__draw_lines(s_, col)
             self.ax_objs[-1].patch.set_alpha(0)
             # Scale all subplots to the same x axis
-            plt.xlim([self.__xmin, self.__xmax])
+            self.ax_objs[-1].set_xlim(self.__xmin, self.__xmax)
             if self.ylim:
-                plt.ylim(self.ylim)
+                self.ax_objs[-1].set_ylim(*self.ylim)
 
             # The length of data is greater than one, fix the plot according to the
             # input args and kwargs.
@@ -264,32 +382,230 @@ class Ridge:
                 self.__resolve_options(i, spines, col)
         return y_min, y_max
 
-    def __x_limit(self, maxx=True) -> tuple[float, float]:
-        if isinstance(self.data[0], tuple):
-            data: list[np.ndarray] = [d[0] for d in self.data]
+    def __collection_main(self) -> None:
+        """Draw all ridges in one axes, see the 'engine' attribute."""
+        ax = self.__fig.add_subplot(self.gs[:, 0:])
+        self.ax_objs = [ax]
+        self.ax = ax
+        n = len(self.data)
+        colors = self.ridge_colors
+        self.__collection = LineCollection([], colors=colors, **self.kwargs)
+        ax.add_collection(self.__collection)
+        self.__lines = [
+            mpl.lines.Line2D([], [], color=col, **self.kwargs) for col in colors
+        ]
+        if self.pltype in ["loglog", "semilogx"]:
+            ax.set_xscale("log")
+        blank = "b" in self.options
+        sides = "s" in self.options or "z" in self.options
+        if n > 1 and sides and not blank:
+            # Odd ridges have their ticks on the right hand side
+            self.ax_objs.append(ax.twinx())
+        for axis in self.ax_objs:
+            axis.patch.set_alpha(0)
+        self.__spines: LineCollection | None = None
+        if blank:
+            for sp in ["top", "bottom", "left", "right"]:
+                ax.spines[sp].set_visible(False)
+            ax.tick_params(
+                axis="both",
+                which="both",
+                bottom=False,
+                left=False,
+                top=False,
+                right=False,
+                labelbottom=False,
+                labelleft=False,
+            )
         else:
-            raise ValueError("'data' must have x-values.")
-        t_min = data[0]
-        x_max = data[0][-1]
-        for t in data[1:]:
-            t_0, t_max = np.min(t), np.max(t)
-            if maxx:
-                t_min = t if t_0 < t_min[0] else t_min
-                # t_max = t if t_1 > t_max[-1] else t_max
-                x_max = max(t_max, x_max)
+            ax.tick_params(axis="x", which="both", top=False)
+            if n > 1 and "z" not in self.options:
+                # Coloured vertical spines for each ridge, as with one axes per ridge
+                for axis in self.ax_objs:
+                    axis.spines["left"].set_visible(False)
+                    axis.spines["right"].set_visible(False)
+                self.__spines = LineCollection(
+                    [],
+                    colors=[col for col in colors for _ in range(2)],
+                    linewidths=mpl.rcParams["axes.linewidth"],
+                    transform=ax.get_yaxis_transform(),
+                    clip_on=False,
+                )
+                ax.add_collection(self.__spines)
+            if self.xlabel:
+                ax.set_xlabel(self.xlabel)
+        if self.ylabel:
+            ax.set_ylabel(self.ylabel)
+        self.__collection_draw()
+
+    def __collection_draw(self) -> None:
+        """Set the line segments, y-ticks and limits of the single axes engine."""
+        n = len(self.data)
+        ax = self.ax_objs[0]
+        # Each ridge is one unit high, or two and overlapping by half when squeezed
+        height = 2.0 if "z" in self.options and n > 1 else 1.0
+        log = self.pltype in ["semilogy", "loglog"]
+        pad = 0.0 if self.ylim else 0.05 / 1.1
+        # Use fewer ticks per ridge, and only tick every few ridges, when the ridges
+        # are too narrow to fit the tick labels
+        band = (ax.get_position().height * self.__fig.get_figheight() * 72 * height) / (
+            n - 1 + height
+        )
+        label = mpl.font_manager.FontProperties(
+            size=mpl.rcParams["ytick.labelsize"]
+        ).get_size_in_points()
+        nbins = int(np.clip(band // (1.5 * label), 1, 3))
+        stride = max(1, int(np.ceil(1.5 * label / band)))
+        segments = []
+        ticks: list[list[tuple[float, float, int]]] = [[], []]
+        for i, s in enumerate(self.data):
+            x, y = self.__line_data(s)
+            y = np.asarray(y, dtype=np.float64)
+            if log:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    y = np.where(y > 0, np.log10(y), np.nan)
+            if self.ylim:
+                lo, hi = self.ylim
+                lo, hi = (np.log10(lo), np.log10(hi)) if log else (lo, hi)
+            else:
+                lo, hi = np.nanmin(y), np.nanmax(y)
+                if not hi > lo:
+                    lo, hi = lo - 0.5, hi + 0.5
+            base = n - 1 - i
+            scale = height * (1 - 2 * pad) / (hi - lo)
+            offset = base + height * pad - lo * scale
+            segments.append(np.column_stack((x, y * scale + offset)))
+            if n == 1 or "b" in self.options or i % stride:
+                continue
+            # The range of values that fit in the band of this ridge
+            view = ((base - offset) / scale, (base + height - offset) / scale)
+            locator = (
+                mpl.ticker.LogLocator(numticks=nbins)
+                if log
+                else mpl.ticker.MaxNLocator(nbins=nbins, steps=[1, 2, 2.5, 5, 10])
+            )
+            values = np.asarray(
+                locator.tick_values(*((10 ** view[0], 10 ** view[1]) if log else view)),
+                dtype=np.float64,
+            )
+            positions = (np.log10(values) if log else values) * scale + offset
+            inside = (positions >= base) & (positions <= base + height)
+            positions, values = positions[inside], values[inside]
+            if stride > 1 and len(values) > 1:
+                middle = np.argmin(np.abs(positions - base - height / 2))
+                positions, values = positions[[middle]], values[[middle]]
+            side = (i // stride) % 2 if len(self.ax_objs) > 1 else 0
+            ticks[side].extend(
+                (pos, value, i) for pos, value in zip(positions, values, strict=True)
+            )
+        self.__collection.set_segments(segments)
+        ax.set_xlim(self.__xmin, self.__xmax)
+        for axis in self.ax_objs:
+            axis.set_ylim(0, n - 1 + height)
+        if self.__spines is not None:
+            self.__spines.set_segments(
+                [
+                    [(side, n - 1 - i), (side, n - i)]
+                    for i in range(n)
+                    for side in (0, 1)
+                ]
+            )
+        if n > 1 and "b" not in self.options:
+            self.__collection_ticks(ticks)
+
+    def __collection_ticks(self, ticks: list[list[tuple[float, float, int]]]) -> None:
+        """Place the y-ticks of each ridge, coloured as the ridge."""
+        colors = self.ridge_colors
+        log = self.pltype in ["semilogy", "loglog"]
+        grid = "g" in self.options
+        for axis, side_ticks in zip(self.ax_objs, ticks, strict=False):
+            axis.yaxis.set_major_locator(
+                mpl.ticker.FixedLocator([pos for pos, _, _ in side_ticks])
+            )
+            axis.yaxis.set_major_formatter(
+                mpl.ticker.FixedFormatter(
+                    [_tick_label(value, log) for _, value, _ in side_ticks]
+                )
+            )
+            axis.yaxis.set_minor_locator(mpl.ticker.NullLocator())
+            if grid:
+                axis.grid(True, axis="y", which="major", alpha=0.2)
+            for tick, (_, _, i) in zip(
+                axis.yaxis.get_major_ticks(), side_ticks, strict=False
+            ):
+                for artist in (
+                    tick.tick1line,
+                    tick.tick2line,
+                    tick.label1,
+                    tick.label2,
+                ):
+                    artist.set_color(colors[i])
+                if grid and "z" in self.options:
+                    tick.gridline.set_linestyle("--" if i % 2 else "-")
+        if len(self.ax_objs) > 1:
+            self.ax_objs[0].tick_params(axis="y", which="both", right=False)
+            self.ax_objs[1].tick_params(
+                axis="y", which="both", left=False, labelright=True
+            )
+        if grid:
+            self.ax_objs[0].grid(True, axis="x", which="major", alpha=0.2)
+
+    @property
+    def ridge_colors(self) -> list[str]:
+        """Return the colour of each ridge.
+
+        The colours only depend on 'palette' and the number of ridges, so the same
+        input always gives the same figure.
+        """
+        if self.palette is None:
+            cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+            return [cycle[i % len(cycle)] for i in range(len(self.data))]
+        return plastik.colors.create_colorlist(self.palette, len(self.data))
+
+    @property
+    def extents(self) -> _Extents:
+        """Return the x- and y-extents of each ridge.
+
+        The data are scanned once, in a single pass over all ridges (on a thread pool
+        if 'workers' is set), and the result is cached until 'data' or 'pltype' is
+        replaced.
+        """
+        if (
+            self._extents_cache is None
+            or self._extents_cache[0] is not self.data
+            or self._extents_cache[1] != self.pltype
+        ):
+            positive = self.pltype in ["loglog", "semilogx"]
+            if self.workers is not None and self.workers > 1:
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    rows = list(
+                        pool.map(lambda s: _series_extents(s, positive), self.data)
+                    )
             else:
-                t_min = t if t[0] > t_min[0] else t_min
-                # t_max = t if t[-1] < t_max[-1] else t_max
-                x_max = min(t_max, x_max)
-        diff = 0.05 * (x_max - t_min[0])
-        # x_max = t_max[-1] + diff
+                rows = [_series_extents(s, positive) for s in self.data]
+            extents = _Extents(*np.array(rows, dtype=np.float64).T)
+            self._extents_cache = (self.data, self.pltype, extents)
+        return self._extents_cache[2]
+
+    def __x_limit(self, maxx=True) -> tuple[float, float]:
+        if not isinstance(self.data[0], tuple):
+            raise ValueError("'data' must have x-values.")
+        extents = self.extents
+        if maxx:
+            first = int(np.argmin(extents.x_min))
+            x_max = extents.x_max.max()
+        else:
+            first = int(np.argmax(extents.x_first))
+            x_max = extents.x_max.min()
+        x_first = extents.x_first[first]
+        diff = 0.05 * (x_max - x_first)
         x_max += diff
         if self.pltype in ["loglog", "semilogx"]:
-            x_min = 0.8 * t_min[t_min > 0][0] if t_min[0] < diff else t_min[0] - diff
-            # if x_min < 0:
-            #     x_min = 1e-10
+            x_min = (
+                0.8 * extents.x_positive[first] if x_first < diff else x_first - diff
+            )
         else:
-            x_min = t_min[0] - diff
+            x_min = x_first - diff
         return x_min, x_max
 
     @property
@@ -322,15 +638,110 @@ class Ridge:
         """Return all the axes."""
         return self.ax_objs
 
+    @phase("Ridge.main")
     def main(self) -> None:
         """Run the main function."""
-        self.set_grid()
-        self.set_xaxs()
+        if self.engine == "collection":
+            with phase("set_grid"):
+                self.set_grid()
+            with phase("set_xaxs"):
+                self.set_xaxs()
+            with phase("collection"):
+                self.__collection_main()
+            return
+        with phase("set_grid"):
+            self.set_grid()
+        with phase("set_xaxs"):
+            self.set_xaxs()
         if self.ylabel:
-            self.set_ylabel()
-        y1, y2 = self.data_loop()
+            with phase("set_ylabel"):
+                self.set_ylabel()
+        with phase("data_loop"):
+            y1, y2 = self.data_loop()
         if self.ylabel:
-            self.set_ylabel(y1, y2)
+            with phase("set_ylabel"):
+                self.set_ylabel(y1, y2)
+
+    def update_data(self, data: list[Any]) -> None:
+        """Replace the plotted data while keeping the figure, axes and styling.
+
+        Only the data of the existing lines are updated, and the axis limits are
+        re-applied. This is much faster than building a new ridge plot, and is what
+        ``render_many`` uses for all but the first dataset.
+
+        Parameters
+        ----------
+        data : list[Any]
+            A list of n 2-tuples with (x, y)-pairs; list of n np.ndarrays: (y). Must
+            have the same length as the data the figure was built with.
+
+        Raises
+        ------
+        ValueError
+            If the figure has not been built yet, or the number of ridges differ.
+        """
+        if not hasattr(self, "ax_objs") or not self.ax_objs:
+            raise ValueError("The figure must be built with 'main' before updating.")
+        if len(data) != len(self.__lines):
+            raise ValueError(
+                f"Expected data for {len(self.__lines)} ridges, got {len(data)}."
+            )
+        self._check_data_type(None, data)
+        self.data = data
+        self.set_xaxs()
+        if self.engine == "collection":
+            self.__collection_draw()
+            return
+        for ax, line, s in zip(self.ax_objs, self.__lines, data, strict=True):
+            line.set_data(*self.__line_data(s))
+            ax.set_xlim((self.__xmin, self.__xmax))
+            if self.ylim:
+                ax.set_ylim(*self.ylim)
+            else:
+                ax.relim()
+                ax.autoscale_view(scalex=False)
+        if self.ylabel:
+            self.set_ylabel(self.extents.y_min.min(), self.extents.y_max.max())
+
+    def render_many(
+        self,
+        datasets: Iterable[list[Any]],
+        paths: Iterable[str | os.PathLike],
+        **kwargs: Any,
+    ) -> None:
+        """Render one ridge plot per dataset to disk, re-using a single figure.
+
+        The figure, axes, spines, ticks and grid are built once from the first dataset,
+        after which only the line data and axis limits are updated for each following
+        dataset. All datasets must have the same number of ridges.
+
+        Parameters
+        ----------
+        datasets : Iterable[list[Any]]
+            The data of each frame, in the format of the 'data' attribute.
+        paths : Iterable[str | os.PathLike]
+            Where to save each frame. Must have the same length as 'datasets'.
+        **kwargs : Any
+            Keyword arguments given to ``Figure.savefig``.
+
+        Examples
+        --------
+        >>> import tempfile, pathlib
+        >>> x = np.linspace(0, 10, 100)
+        >>> datasets = [[(x, np.sin(x + p)), (x, np.cos(x + p))] for p in range(3)]
+        >>> tmp = pathlib.Path(tempfile.mkdtemp())
+        >>> r = Ridge(datasets[0], "gs")
+        >>> r.render_many(datasets, [tmp / f"{i}.png" for i in range(3)])
+        >>> sorted(p.name for p in tmp.iterdir())
+        ['0.png', '1.png', '2.png']
+        """
+        for i, (data, path) in enumerate(zip(datasets, paths, strict=True)):
+            if i == 0 and not getattr(self, "ax_objs", None):
+                self.data = data
+                self.main()
+            else:
+                self.update_data(data)
+            self.figure.savefig(path, **kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""Tests of ``plastik.airport``."""
+
+import math
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plastik.airport import _BACKENDS, Airport, _bandwidth, _ecdf, _kde, _norm_cdf
+
+
+def test_norm_cdf():
+    z = np.linspace(-30, 10, 4001)
+    expected = np.array([0.5 * math.erfc(-v / math.sqrt(2)) for v in z])
+    np.testing.assert_allclose(_norm_cdf(z), expected, rtol=1.2e-7, atol=0)
+
+
+def _direct_kde(x, y, h):
+    z = (x[:, np.newaxis] - y) / h
+    return np.exp(-0.5 * z**2).sum(axis=1) / (y.size * h * np.sqrt(2 * np.pi))
+
+
+@pytest.mark.parametrize("size", [1, 50, 2000])
+def test_kde_matches_a_direct_gaussian_sum(size):
+    y = np.random.default_rng(size).gamma(2, size=size)
+    x = np.linspace(y.min() - 2, y.max() + 2, 301)
+    density = _kde(x, y)
+    expected = _direct_kde(x, y, _bandwidth(y))
+    np.testing.assert_allclose(density, expected, rtol=0, atol=1e-3 * expected.max())
+
+
+@pytest.mark.parametrize("complementary", [False, True])
+def test_ecdf_matches_sorted_ranks(complementary):
+    # Integers give ties, and evaluating at the samples checks the side of the steps
+    y = np.random.default_rng(0).integers(0, 20, size=500).astype(float)
+    x = np.concatenate((np.unique(y), np.linspace(-1, 21, 45)))
+    sorted_y = np.sort(y)
+    # The rank of each point: the number of samples at most equal to it
+    ranks = np.array([np.flatnonzero(sorted_y <= v).size for v in x])
+    expected = (y.size - ranks if complementary else ranks) / y.size
+    np.testing.assert_array_equal(_ecdf(x, y, complementary=complementary), expected)
+    name = "ccdf" if complementary else "ecdf"
+    discrete, continuous = _BACKENDS[name]
+    np.testing.assert_array_equal(continuous(x, y), expected)
+    bins, dist = discrete(10, y)
+    np.testing.assert_array_equal(dist, _ecdf(bins, y, complementary=complementary))
+
+
+def _drawn_data(fig):
+    """Return the data of the lines and the points of the scatter plots of a figure."""
+    lines = [line.get_xydata() for line in fig.findobj(mpl.lines.Line2D)]
+    points = [c.get_offsets() for c in fig.findobj(mpl.collections.Collection)]
+    return [data for data in lines + points if len(data)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("backend", list(_BACKENDS))
+def test_plot_many_matches_plot(backend, workers):
+    rng = np.random.default_rng(0)
+    triples = []
+    for size in (100, 100, 300):
+        arr1 = rng.normal(size=size)
+        triples.append(
+            (arr1, arr1 + rng.normal(0.1, 0.2, size), rng.normal(0, 0.2, size))
+        )
+    many = Airport()
+    many.config()
+    many.set_dist_func(backend)
+    fig_many, axs_many = plt.subplots(1, len(triples))
+    many.plot_many(triples, axs_many, workers=workers)
+    single = Airport()
+    single.config()
+    single.set_dist_func(backend)
+    fig_single, axs_single = plt.subplots(1, len(triples))
+    for triple, ax in zip(triples, axs_single, strict=True):
+        single.plot(*triple, ax)
+    lines_many, lines_single = _drawn_data(fig_many), _drawn_data(fig_single)
+    assert len(lines_many) == len(lines_single) > 0
+    for line_many, line_single in zip(lines_many, lines_single, strict=True):
+        np.testing.assert_allclose(line_many, line_single, rtol=1e-12, atol=1e-12)
+    plt.close(fig_many)
+    plt.close(fig_single)
@@ -0,0 +1,94 @@
+"""Tests of ``plastik.cache``."""
+
+import functools
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plastik.cache import RenderCache, hash_inputs
+
+
+def _make(color):
+    def draw():
+        fig, ax = plt.subplots()
+        ax.set_facecolor(color)
+        return fig
+
+    return draw
+
+
+def _figure():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    return fig
+
+
+def test_closures_hash_by_their_contents():
+    assert hash_inputs(_make("red")) == hash_inputs(_make("red"))
+    assert hash_inputs(_make("red")) != hash_inputs(_make("blue"))
+    assert hash_inputs(lambda: 1) != hash_inputs(lambda: 2)
+    a, b = np.zeros(3), np.ones(3)
+    assert hash_inputs(lambda ax: ax.plot(a)) != hash_inputs(lambda ax: ax.plot(b))
+
+
+def test_partials_hash_by_their_arguments():
+    assert hash_inputs(functools.partial(_make, "red")) == hash_inputs(
+        functools.partial(_make, "red")
+    )
+    assert hash_inputs(functools.partial(_make, "red")) != hash_inputs(
+        functools.partial(_make, "blue")
+    )
+    assert hash_inputs(np.sin) != hash_inputs(np.cos)
+
+
+class _Unpicklable:
+    def __init__(self):
+        self.draw = lambda: None
+
+
+def test_unhashable_values_raise():
+    with pytest.raises(TypeError, match="_Unpicklable"):
+        hash_inputs(_Unpicklable())
+
+
+def test_closures_render_to_different_files(tmp_path):
+    rc = RenderCache(tmp_path)
+    red = rc.render(_make("red"))
+    blue = rc.render(_make("blue"))
+    assert red != blue
+    assert red.read_bytes() != blue.read_bytes()
+    assert rc.info().misses == 2
+
+
+def test_files_honour_the_umask(tmp_path):
+    umask = os.umask(0o027)
+    try:
+        path = RenderCache(tmp_path).put("key", "png", _figure())
+    finally:
+        os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_put_scans_the_directory_only_when_full(tmp_path, monkeypatch):
+    rc = RenderCache(tmp_path, max_bytes=1 << 30)
+    scans = []
+    files = rc._files
+
+    def count_files():
+        scans.append(1)
+        return files()
+
+    monkeypatch.setattr(rc, "_files", count_files)
+    fig = _figure()
+    for i in range(5):
+        rc.put(f"key{i}", "png", fig)
+    assert len(scans) == 1
+    size = rc.info().size
+    rc.max_bytes = size + size // 10
+    rc.put("key5", "png", fig)
+    # The written file is kept, and the oldest ones make room for it
+    assert os.path.exists(rc.path("key5", "png"))
+    assert rc.info().size <= rc.max_bytes
+    assert rc.info().evictions >= 1
@@ -0,0 +1,85 @@
+"""Tests of ``plastik.decimate``."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plastik import decimate
+
+
+def _bucket_of(x, buckets, log=False):
+    """Return the bucket of each sample, computed directly from the definition."""
+    pos = np.log10(x) if log else x
+    return np.minimum(
+        ((pos - pos.min()) * (buckets / (pos.max() - pos.min()))).astype(int),
+        buckets - 1,
+    )
+
+
+@pytest.mark.parametrize("log", [False, True])
+def test_m4_keeps_first_last_min_and_max_of_each_bucket(log):
+    rng = np.random.default_rng(0)
+    x = np.logspace(0, 3, 5000) if log else np.sort(rng.uniform(0, 10, 5000))
+    y = rng.normal(size=x.size)
+    x_, y_ = decimate.m4(x, y, 50, log=log)
+    assert len(x_) <= 4 * 50
+    bucket, kept = _bucket_of(x, 50, log), _bucket_of(x_, 50, log)
+    for b in range(50):
+        full, reduced = y[bucket == b], y_[kept == b]
+        assert full[0] == reduced[0]
+        assert full[-1] == reduced[-1]
+        assert full.min() == reduced.min()
+        assert full.max() == reduced.max()
+        np.testing.assert_array_equal(np.isin(reduced, full), True)
+
+
+@pytest.mark.parametrize("buckets", [0, 25, 100])
+def test_short_input_is_unchanged(buckets):
+    x = np.arange(100.0)
+    y = np.sin(x)
+    x_, y_ = decimate.m4(x, y, buckets)
+    np.testing.assert_array_equal(x_, x)
+    np.testing.assert_array_equal(y_, y)
+    x_, lower, upper = decimate.envelope(x, y - 1, y + 1, 2 * buckets)
+    np.testing.assert_array_equal(x_, x)
+    np.testing.assert_array_equal(lower, y - 1)
+    np.testing.assert_array_equal(upper, y + 1)
+
+
+@pytest.mark.parametrize("log", [False, True])
+def test_x_stays_monotonic(log):
+    rng = np.random.default_rng(1)
+    x = np.logspace(-2, 2, 10_000) if log else np.linspace(-5, 5, 10_000)
+    y = rng.normal(size=x.size).cumsum()
+    x_, _ = decimate.m4(x, y, 80, log=log)
+    assert np.all(np.diff(x_) > 0)
+    x_, _, _ = decimate.envelope(x, y - 1, y + 1, 80, log=log)
+    assert np.all(np.diff(x_) >= 0)
+
+
+def test_envelope_bounds_the_data():
+    rng = np.random.default_rng(2)
+    x = np.linspace(0, 1, 3000)
+    lower = rng.normal(size=(3, x.size)).cumsum(axis=1)
+    upper = lower + rng.uniform(0, 1, size=lower.shape)
+    x_, lower_, upper_ = decimate.envelope(x, lower, upper, 40)
+    assert lower_.shape == upper_.shape == (3, len(x_))
+    # Each bucket is drawn from its first to its last x-value
+    for start, end, low, high in zip(
+        x_[::2], x_[1::2], lower_[:, ::2].T, upper_[:, ::2].T, strict=True
+    ):
+        inside = (x >= start) & (x <= end)
+        assert inside.any()
+        assert np.all(low[:, np.newaxis] <= lower[:, inside])
+        assert np.all(high[:, np.newaxis] >= upper[:, inside])
+    assert x_[0] == x[0]
+    assert x_[-1] == x[-1]
+
+
+def test_n_buckets():
+    fig, ax = plt.subplots(figsize=(4, 3), dpi=100)
+    assert decimate.n_buckets(ax, True) == decimate.pixel_width(ax)
+    assert 0 < decimate.pixel_width(ax) <= 400
+    assert decimate.n_buckets(ax, 123) == 123
+    assert decimate.n_buckets(ax, False) == 0
+    plt.close(fig)
@@ -0,0 +1,69 @@
+"""Tests of ``plastik.grid``."""
+
+import hashlib
+import io
+
+import matplotlib as mpl
+import pytest
+
+import plastik
+from plastik.grid import FigurePool
+
+
+def _render(pool: FigurePool) -> str:
+    fig, axs = pool(1, 2)
+    for ax in axs:
+        ax.plot([0, 1], [0, 1])
+        ax.plot([0, 1], [1, 0])
+    buffer = io.BytesIO()
+    pool.savefig(fig, buffer, format="png")
+    return hashlib.md5(buffer.getvalue()).hexdigest()
+
+
+def test_reused_figure_starts_the_colour_cycle():
+    pool = FigurePool()
+    fig, axs = pool(1, 2)
+    axs[0].plot([0, 1])
+    axs[0].margins(0.3)
+    axs[0].set_facecolor("red")
+    pool.release(fig)
+    fig, axs = pool(1, 2)
+    assert pool.info().hits == 1
+    (line,) = axs[0].plot([0, 1])
+    assert mpl.colors.same_color(line.get_color(), "C0")
+    assert axs[0].margins() == (
+        mpl.rcParams["axes.xmargin"],
+        mpl.rcParams["axes.ymargin"],
+    )
+    assert mpl.colors.same_color(axs[0].get_facecolor(), mpl.rcParams["axes.facecolor"])
+    pool.release(fig)
+
+
+def test_reused_figure_renders_the_same():
+    pool = FigurePool()
+    assert len({_render(pool) for _ in range(3)}) == 1
+    assert pool.info().hits == 2
+
+
+def test_shared_axes_are_not_reused():
+    pool = FigurePool()
+    fig, axs = pool(1, 2)
+    axs[1].sharex(axs[0])
+    pool.release(fig)
+    assert pool.info().idle == 0
+    fig, _ = pool(1, 2)
+    assert pool.info().misses == 2
+    pool.release(fig)
+
+
+def test_release_unknown_figure():
+    with pytest.raises(ValueError, match="not in use"):
+        FigurePool().release(mpl.figure.Figure())
+
+
+def test_star_import_exports_only_the_public_names():
+    namespace: dict = {}
+    exec("from plastik.grid import *", namespace)
+    assert "FigurePool" in namespace
+    assert not {"np", "plt", "threading", "_reset"} & set(namespace)
+    assert not hasattr(plastik, "threading")
@@ -0,0 +1,28 @@
+"""Tests of the lazy attributes of ``plastik``."""
+
+import subprocess
+import sys
+
+import pytest
+
+CHECK = """
+import plastik
+from plastik.airport import Airport as Class
+assert plastik.Airport is Class
+assert isinstance(plastik.airport, Class)
+"""
+
+
+@pytest.mark.parametrize(
+    "first",
+    [
+        "plastik.Airport",
+        "plastik.airport",
+        "importlib.import_module('plastik.airport')",
+        "__import__('plastik.airport')",
+    ],
+)
+def test_airport_is_the_instance(first):
+    # Each order needs a fresh interpreter, since the submodule is only imported once
+    code = f"import importlib\nimport plastik\n{first}\n{CHECK}"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,47 @@
+"""Tests of ``plastik.parallel``."""
+
+import functools
+
+import pytest
+
+from plastik.parallel import RenderJob, render_parallel
+
+
+def _draw(fig, axs, lines=1):
+    for i in range(lines):
+        axs[0].plot([0, 1], [0, i])
+
+
+def test_identical_jobs_give_identical_images(tmp_path):
+    # The first job leaves its figure in the worker's pool for the later jobs
+    jobs = [
+        RenderJob(functools.partial(_draw, lines=3), tmp_path / "warm.png"),
+        RenderJob(_draw, tmp_path / "a.png"),
+        RenderJob(_draw, tmp_path / "b.png"),
+    ]
+    results = render_parallel(jobs, workers=1)
+    assert all(result.ok for result in results)
+    assert (tmp_path / "a.png").read_bytes() == (tmp_path / "b.png").read_bytes()
+
+
+def test_unpicklable_job_does_not_stop_the_others(tmp_path):
+    jobs = [
+        RenderJob(_draw, tmp_path / "a.png"),
+        RenderJob(lambda fig, axs: None, tmp_path / "b.png"),
+        RenderJob(_draw, tmp_path / "c.png"),
+    ]
+    results = render_parallel(jobs, workers=2)
+    assert [result.ok for result in results] == [True, False, True]
+    assert "pickle" in str(results[1].error).lower()
+    assert (tmp_path / "c.png").exists()
+
+
+def test_failing_draw_is_reported(tmp_path):
+    results = render_parallel([(_draw, tmp_path / "a.png", 1, 1, None, {"x": 1})])
+    assert not results[0].ok
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunksize": 0}])
+def test_invalid_arguments(tmp_path, kwargs):
+    with pytest.raises(ValueError, match="must be positive"):
+        render_parallel([(_draw, tmp_path / "a.png")], **kwargs)
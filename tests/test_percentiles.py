@@ -0,0 +1,79 @@
+"""Tests of ``plastik.percentiles``."""
+
+import numpy as np
+import pytest
+
+from plastik.percentiles import percentile_bands, percentile_bands_streaming
+
+
+def _reference(y, n):
+    lower = np.linspace(1, 50, num=n, endpoint=False)
+    upper = np.linspace(50, 99, num=n + 1)[1:]
+    return (
+        np.percentile(y, lower, axis=0),
+        np.percentile(y, upper, axis=0),
+        np.percentile(y, 50, axis=0),
+    )
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_integer_input(workers):
+    y = np.random.default_rng(0).integers(-100, 100, size=(50, 7))
+    bands = percentile_bands(y, n=4, workers=workers)
+    lower, upper, median = _reference(y, 4)
+    np.testing.assert_allclose(bands.lower, lower)
+    np.testing.assert_allclose(bands.upper, upper)
+    np.testing.assert_allclose(bands.median, median)
+    np.testing.assert_allclose(bands.mean, y.mean(axis=0))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_nan_columns_propagate(workers):
+    y = np.random.default_rng(0).normal(size=(50, 6))
+    y[3, 1] = np.nan
+    y[:, 4] = np.nan
+    bands = percentile_bands(y, n=4, workers=workers)
+    lower, upper, median = _reference(y, 4)
+    np.testing.assert_array_equal(np.isnan(bands.lower), np.isnan(lower))
+    np.testing.assert_allclose(bands.lower, lower)
+    np.testing.assert_allclose(bands.upper, upper)
+    np.testing.assert_allclose(bands.median, median)
+    assert np.isnan(bands.mean[[1, 4]]).all()
+
+
+def _assert_within_bound(bands, exact):
+    assert bands.error > 0
+    for estimate, expected in zip(bands[:3], exact[:3], strict=True):
+        assert np.all(np.abs(estimate - expected) <= bands.error * (1 + 1e-9))
+    np.testing.assert_allclose(bands.mean, exact.mean)
+
+
+@pytest.mark.parametrize("bins", [4, 32, 256, 2048])
+@pytest.mark.parametrize("chunk_size", [None, 7, 1000])
+def test_streaming_is_within_one_bin_width(bins, chunk_size):
+    rng = np.random.default_rng(bins)
+    y = np.concatenate(
+        (rng.normal(size=(600, 8)), rng.gamma(0.5, size=(600, 8)) * 3), axis=1
+    )
+    bands = percentile_bands_streaming(y, n=6, bins=bins, chunk_size=chunk_size)
+    _assert_within_bound(bands, percentile_bands(y, n=6))
+
+
+@pytest.mark.parametrize("bins", [16, 256])
+def test_streaming_memmap_and_chunks(tmp_path, bins):
+    y = np.random.default_rng(0).standard_t(3, size=(2500, 5))
+    memmap = np.memmap(tmp_path / "y.dat", dtype=np.float64, mode="w+", shape=y.shape)
+    memmap[:] = y
+    memmap.flush()
+    exact = percentile_bands(y, n=4)
+    memmap = np.memmap(tmp_path / "y.dat", dtype=np.float64, mode="r", shape=y.shape)
+    _assert_within_bound(
+        percentile_bands_streaming(memmap, n=4, bins=bins, chunk_size=300), exact
+    )
+    # One-shot chunks of any size need the range up front
+    value_range = (float(y.min()), float(y.max()))
+    chunks = (y[i : i + 333] for i in range(0, len(y), 333))
+    _assert_within_bound(
+        percentile_bands_streaming(chunks, n=4, bins=bins, value_range=value_range),
+        exact,
+    )
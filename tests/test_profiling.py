@@ -0,0 +1,46 @@
+"""Tests of ``plastik.profiling``."""
+
+import tracemalloc
+
+import numpy as np
+
+from plastik.profiling import phase, profile
+
+
+def _allocate(size):
+    with phase("allocate"):
+        block = np.ones(size, dtype=np.uint8)
+        del block
+
+
+def test_phases_keep_the_peak_of_the_enclosing_phase():
+    with profile() as prof:
+        with phase("outer"):
+            _allocate(8_000_000)
+            _allocate(1_000)
+    records = {record["phase"]: record for record in prof.records}
+    assert records["outer"]["peak"] >= 8_000_000
+    assert prof.peak is not None
+    assert prof.peak >= 8_000_000
+
+
+def test_nested_profile_keeps_the_outer_peak():
+    with profile() as outer:
+        with phase("outer"):
+            with profile() as inner:
+                _allocate(8_000_000)
+                _allocate(1_000)
+    assert [record["phase"] for record in inner.records] == ["allocate", "allocate"]
+    assert outer.records[0]["peak"] >= 8_000_000
+    assert inner.peak is not None
+    assert inner.peak >= 8_000_000
+    assert outer.peak is not None
+    assert outer.peak >= 8_000_000
+
+
+def test_no_memory():
+    with profile(memory=False) as prof:
+        _allocate(1_000)
+    assert "peak" not in prof.records[0]
+    assert prof.peak is None
+    assert not tracemalloc.is_tracing()
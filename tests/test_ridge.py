@@ -0,0 +1,167 @@
+"""Tests of ``plastik.ridge``."""
+
+import matplotlib as mpl
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+
+from plastik.ridge import Ridge
+
+
+def test_colors_is_a_deprecated_cycle():
+    ridge = Ridge([np.arange(3), np.arange(4)], "", palette="cmc.batlow")
+    with pytest.warns(DeprecationWarning, match="ridge_colors"):
+        colors = ridge.colors
+    expected = ridge.ridge_colors
+    assert [next(colors) for _ in range(4)] == expected + expected
+
+
+def test_class_colors_is_a_deprecated_cycle():
+    with pytest.warns(DeprecationWarning, match="ridge_colors"):
+        colors = Ridge.colors
+    cycle = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    assert [next(colors) for _ in range(len(cycle) + 1)] == [*cycle, cycle[0]]
+
+
+def test_extents_follow_pltype():
+    x = np.array([0.0, 1.0, 10.0])
+    ridge = Ridge([(x, x + 1)], "")
+    assert np.isnan(ridge.extents.x_positive[0])
+    ridge.pltype = "loglog"
+    assert ridge.extents.x_positive[0] == 1
+
+
+def _ridge_data():
+    rng = np.random.default_rng(0)
+    x = np.linspace(1, 10, 50)
+    return [(x, np.exp(rng.normal(size=50)) * (i + 1)) for i in range(3)]
+
+
+def _tick_labels(ax):
+    """Return the visible y-tick labels of an axes by colour, with their position."""
+    labels: dict = {}
+    low, high = sorted(ax.get_ylim())
+    for label in ax.yaxis.get_majorticklabels():
+        loc = label.get_position()[1]
+        if label.get_text() and low <= loc <= high:
+            y = round(ax.transData.transform((0, loc))[1], 6)
+            color = mpl.colors.to_hex(label.get_color())
+            labels.setdefault(color, set()).add((label.get_text(), y))
+    return labels
+
+
+@pytest.mark.parametrize("options", ["", "s", "z", "gs"])
+@pytest.mark.parametrize("pltype", ["plot", "semilogy", "semilogx", "loglog"])
+def test_collection_engine_matches_axes_engine(pltype, options):
+    data = _ridge_data()
+    axes = Ridge(data, options, pltype=pltype, pyplot=False)
+    axes.main()
+    collection = Ridge(data, options, pltype=pltype, pyplot=False, engine="collection")
+    collection.main()
+    axes.figure.canvas.draw()
+    collection.figure.canvas.draw()
+    assert axes.ridge_colors == collection.ridge_colors
+    single = collection.ax_objs[0]
+    lines = single.collections[0]
+    assert isinstance(lines, LineCollection)
+    np.testing.assert_array_equal(
+        mpl.colors.to_rgba_array(lines.get_colors()),
+        mpl.colors.to_rgba_array(collection.ridge_colors),
+    )
+    collection_labels: dict = {}
+    for ax in collection.ax_objs:
+        for color, labels in _tick_labels(ax).items():
+            collection_labels.setdefault(color, set()).update(labels)
+    for i, ax in enumerate(axes.ax_objs):
+        line = ax.lines[0]
+        assert mpl.colors.to_hex(line.get_color()) == mpl.colors.to_hex(
+            collection.ridge_colors[i]
+        )
+        # The same data at the same place on the figure, so also at the same offset
+        np.testing.assert_allclose(
+            single.transData.transform(lines.get_segments()[i]),
+            ax.transData.transform(line.get_xydata()),
+            atol=1e-9,
+        )
+        # Each tick of the ridge is where the axes engine puts the same value
+        ((color, labels),) = _tick_labels(ax).items()
+        formatter = ax.yaxis.get_major_formatter()
+        for text, y in collection_labels[color]:
+            value = ax.transData.inverted().transform((0, y))[1]
+            if ax.get_yscale() == "log":
+                value = 10 ** round(np.log10(value), 6)
+            else:
+                value = round(value, 6) + 0.0
+            assert formatter(value) == text
+        if "z" not in options:
+            # The single axes may fit more ticks in a ridge, but has all of the others
+            assert labels <= collection_labels[color]
+
+
+def _datasets():
+    x = np.linspace(0, 10, 200)
+    return [
+        [(x, np.sin(x + p)), (x, (p + 1) * np.cos(x)), (x + p, x**p)] for p in range(3)
+    ]
+
+
+def _state(ridge):
+    """Return the drawn data, limits and tick labels of each axes of a ridge plot."""
+    ridge.figure.canvas.draw()
+    state = []
+    for ax in ridge.ax_objs:
+        lines = [line.get_xydata() for line in ax.lines]
+        lines += [np.concatenate(c.get_segments()) for c in ax.collections]
+        labels = [label.get_text() for label in ax.yaxis.get_majorticklabels()]
+        state.append((lines, ax.get_xlim(), ax.get_ylim(), labels))
+    return state
+
+
+@pytest.mark.parametrize("engine", ["axes", "collection"])
+@pytest.mark.parametrize("options", ["", "gs", "z"])
+def test_update_data_matches_a_new_ridge(engine, options):
+    first, *_, last = _datasets()
+    updated = Ridge(first, options, engine=engine, pyplot=False, ylabel="y")
+    updated.main()
+    updated.update_data(last)
+    fresh = Ridge(last, options, engine=engine, pyplot=False, ylabel="y")
+    fresh.main()
+    for (lines, xlim, ylim, labels), expected in zip(
+        _state(updated), _state(fresh), strict=True
+    ):
+        for line, expected_line in zip(lines, expected[0], strict=True):
+            np.testing.assert_allclose(line, expected_line)
+        np.testing.assert_allclose(xlim, expected[1])
+        np.testing.assert_allclose(ylim, expected[2])
+        assert labels == expected[3]
+
+
+def test_update_data_invalidates_the_extents():
+    first, second, _ = _datasets()
+    ridge = Ridge(first, "", pyplot=False)
+    ridge.main()
+    assert ridge.extents.x_max[2] == 10
+    ridge.update_data(second)
+    assert ridge.extents.x_max[2] == 11
+    np.testing.assert_allclose(ridge.extents.y_max, [max(y) for _, y in second])
+
+
+def test_update_data_checks_the_number_of_ridges():
+    first, *_ = _datasets()
+    ridge = Ridge(first, "", pyplot=False)
+    with pytest.raises(ValueError, match="main"):
+        ridge.update_data(first)
+    ridge.main()
+    with pytest.raises(ValueError, match="3 ridges"):
+        ridge.update_data(first[:2])
+
+
+def test_render_many_saves_one_figure_per_dataset(tmp_path):
+    datasets = _datasets()
+    paths = [tmp_path / f"{i}.png" for i in range(len(datasets))]
+    Ridge(datasets[0], "gs", pyplot=False).render_many(datasets, paths)
+    for data, path in zip(datasets, paths, strict=True):
+        fresh = Ridge(data, "gs", pyplot=False)
+        fresh.main()
+        fresh.figure.savefig(tmp_path / "fresh.png")
+        assert path.read_bytes() == (tmp_path / "fresh.png").read_bytes()